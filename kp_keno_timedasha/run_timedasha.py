@@ -14,6 +14,17 @@ except ImportError:
     swe = None
     HAVE_SWISSEPH = False
 
+# ---------------------------------------------------------
+# orjson (optional, schnellere JSON-Ausgabe)
+# ---------------------------------------------------------
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None
+    HAVE_ORJSON = False
+
 # ---------------------------------------------------------
 # Vimshottari-Konstanten
 # ---------------------------------------------------------
@@ -39,6 +50,14 @@ TOTAL_YEARS = 120.0
 NAKSHATRA_COUNT = 27
 NAKSHATRA_SIZE = 360.0 / NAKSHATRA_COUNT  # 13°20'
 
+# Mondlänge -> Nakshatra-Index per Multiplikation statt Division,
+# Nakshatra-Index -> Dasha-Lord per Tabelle statt Modulo.
+# Ein Eintrag mehr, falls lon knapp unter 360° auf 27.0 rundet.
+_NAK_SCALE = NAKSHATRA_COUNT / 360.0
+_NAK_TO_LORD = tuple(
+    DASHA_ORDER[i % len(DASHA_ORDER)] for i in range(NAKSHATRA_COUNT + 1)
+)
+
 
 # ---------------------------------------------------------
 # Hilfsfunktionen
@@ -52,6 +71,11 @@ def rotate_order_to(start_lord: str):
     return DASHA_ORDER[idx:] + DASHA_ORDER[:idx]
 
 
+def _fmt_min(dt):
+    """datetime -> 'YYYY-MM-DD HH:MM' (ohne strftime-Formatparsing)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
 def find_interval(segments, t):
     """Finde das Segment, in dem t liegt."""
     for seg in segments:
@@ -94,19 +118,8 @@ def fake_sunrise(date, loc):
     return tz.localize(datetime.datetime(date.year, date.month, date.day, 8, 0, 0))
 
 
-def swe_sunrise(date, loc):
-    """
-    Berechnet Sonnenaufgang mit Swiss Ephemeris für den gegebenen Tag und Ort.
-    Erwartet, dass swe (pyswisseph) importiert wurde.
-    """
-    if not HAVE_SWISSEPH:
-        return fake_sunrise(date, loc)
-
-    lat = float(loc["lat"])
-    lon = float(loc["lon"])
-
-    # Start: 0:00 Ortszeit -> UTC
-    tz = pytz.timezone(loc["tz"])
+def _local_midnight_jd(date, tz):
+    """JD (UT) von 0:00 Ortszeit des gegebenen Tages."""
     dt_local_midnight = tz.localize(
         datetime.datetime(date.year, date.month, date.day, 0, 0, 0)
     )
@@ -121,8 +134,11 @@ def swe_sunrise(date, loc):
         + dt_utc_midnight.second / 3600.0
     )
 
-    jd_start = swe.julday(year, month, day, hour)
+    return swe.julday(year, month, day, hour)
+
 
+def _rise_after(jd_start, lat, lon):
+    """JD des nächsten Sonnenaufgangs nach jd_start."""
     rs = swe.rise_trans(
         jd_start,
         swe.SUN,
@@ -132,11 +148,12 @@ def swe_sunrise(date, loc):
         0.0,   # Temperatur
         swe.BIT_DISC_CENTER | swe.CALC_RISE
     )
+    return rs[0]  # erster Eintrag: JD des Ereignisses
 
-    jd_rise = rs[0]  # erster Eintrag: JD des Ereignisses
 
-    # JD -> UTC-Datetime
-    y, m, d, ut_hour = swe.revjul(jd_rise)
+def _jd_to_local(jd, tz):
+    """JD (UT) -> timezone-aware datetime in Ortszeit."""
+    y, m, d, ut_hour = swe.revjul(jd)
     ut_h = int(ut_hour)
     ut_min = int((ut_hour - ut_h) * 60)
     ut_sec = int(round(((ut_hour - ut_h) * 60 - ut_min) * 60))
@@ -145,11 +162,80 @@ def swe_sunrise(date, loc):
     return dt_utc.astimezone(tz)
 
 
-def get_sunrise(date, loc):
+def swe_sunrise(date, loc):
     """
-    Wrapper: nutze Swiss Ephemeris, falls vorhanden;
-    sonst Fallback fake_sunrise.
+    Berechnet Sonnenaufgang mit Swiss Ephemeris für den gegebenen Tag und Ort.
+    Erwartet, dass swe (pyswisseph) importiert wurde.
+    """
+    if not HAVE_SWISSEPH:
+        return fake_sunrise(date, loc)
+
+    lat = float(loc["lat"])
+    lon = float(loc["lon"])
+
+    # Start: 0:00 Ortszeit -> UTC
+    tz = pytz.timezone(loc["tz"])
+    jd_start = _local_midnight_jd(date, tz)
+
+    return _jd_to_local(_rise_after(jd_start, lat, lon), tz)
+
+
+# Abstand vom letzten Sonnenaufgang zum Startwert der nächsten Suche
+# (knapp unter einem Tag, damit der nächste Aufgang sicher folgt).
+SUNRISE_STREAM_STEP = 0.95
+
+
+def sunrise_stream(start_date, n_days, loc):
+    """
+    Sonnenaufgänge für n_days aufeinanderfolgende Tage ab start_date.
+    Jede Suche startet kurz vor dem erwarteten Aufgang (letzter JD +
+    SUNRISE_STREAM_STEP) statt um Mitternacht.
+    Liefert eine Liste von (date, sunrise).
     """
+    dates = [start_date + datetime.timedelta(days=i) for i in range(n_days)]
+
+    if not HAVE_SWISSEPH:
+        return [(d, fake_sunrise(d, loc)) for d in dates]
+
+    lat = float(loc["lat"])
+    lon = float(loc["lon"])
+    tz = pytz.timezone(loc["tz"])
+
+    out = []
+    jd_seed = None
+    for d in dates:
+        try:
+            if jd_seed is None:
+                jd_seed = _local_midnight_jd(d, tz)
+            jd_rise = _rise_after(jd_seed, lat, lon)
+            sunrise = _jd_to_local(jd_rise, tz)
+            if sunrise.date() != d:
+                # Seed hat den Tag verfehlt -> regulär ab Mitternacht
+                jd_rise = _rise_after(_local_midnight_jd(d, tz), lat, lon)
+                sunrise = _jd_to_local(jd_rise, tz)
+            jd_seed = jd_rise + SUNRISE_STREAM_STEP
+        except Exception:
+            sunrise = fake_sunrise(d, loc)
+            jd_seed = None
+        out.append((d, sunrise))
+
+    return out
+
+
+# ---------------------------------------------------------
+# Sonnenaufgangs-Cache
+# ---------------------------------------------------------
+
+# (date, lat, lon, tz) -> sunrise; YEAR/MONTH/WEEK-Frames vieler
+# Ziehungsdaten teilen sich dieselben Frame-Grenzen.
+_SUNRISE_CACHE = {}
+
+
+def _sunrise_key(date, loc):
+    return (date, loc["lat"], loc["lon"], loc["tz"])
+
+
+def _compute_sunrise(date, loc):
     if HAVE_SWISSEPH:
         try:
             return swe_sunrise(date, loc)
@@ -159,6 +245,57 @@ def get_sunrise(date, loc):
         return fake_sunrise(date, loc)
 
 
+def get_sunrise(date, loc):
+    """
+    Wrapper: nutze Swiss Ephemeris, falls vorhanden;
+    sonst Fallback fake_sunrise. Ergebnisse werden gecacht.
+    """
+    key = _sunrise_key(date, loc)
+    sunrise = _SUNRISE_CACHE.get(key)
+    if sunrise is None:
+        sunrise = _compute_sunrise(date, loc)
+        _SUNRISE_CACHE[key] = sunrise
+    return sunrise
+
+
+def frame_sunrise_dates(date):
+    """Alle Tage, deren Sonnenaufgang die Frames eines Ziehungstags braucht."""
+    year, month = date.year, date.month
+    monday = date - datetime.timedelta(days=date.weekday())
+    return {
+        datetime.date(year, 1, 1),
+        datetime.date(year + 1, 1, 1),
+        datetime.date(year, month, 1),
+        datetime.date(year + 1, 1, 1) if month == 12
+        else datetime.date(year, month + 1, 1),
+        monday,
+        monday + datetime.timedelta(days=7),
+    }
+
+
+def prefetch_sunrises(dates, loc):
+    """
+    Füllt den Sonnenaufgangs-Cache für alle Frames der gegebenen Daten.
+    Zusammenhängende Tagesfolgen werden per sunrise_stream gerechnet.
+    """
+    needed = set()
+    for date in dates:
+        needed |= frame_sunrise_dates(date)
+    needed = sorted(d for d in needed if _sunrise_key(d, loc) not in _SUNRISE_CACHE)
+
+    i = 0
+    while i < len(needed):
+        j = i
+        while (
+            j + 1 < len(needed)
+            and needed[j + 1] - needed[j] == datetime.timedelta(days=1)
+        ):
+            j += 1
+        for d, sunrise in sunrise_stream(needed[i], j - i + 1, loc):
+            _SUNRISE_CACHE[_sunrise_key(d, loc)] = sunrise
+        i = j + 1
+
+
 # ---------------------------------------------------------
 # Mond / Nakshatra / Start-Lord (Lahiri)
 # ---------------------------------------------------------
@@ -211,9 +348,8 @@ def get_start_lord_for_frame(frame_start, loc):
         # vorerst KETU als Platzhalter.
         return "KETU"
 
-    nak_index = int(moon_lon / NAKSHATRA_SIZE)  # 0..26, 0 = Ashwini
-    dasha_lord = DASHA_ORDER[nak_index % len(DASHA_ORDER)]
-    return dasha_lord
+    # 0..26, 0 = Ashwini
+    return _NAK_TO_LORD[int(moon_lon * _NAK_SCALE)]
 
 
 def debug_print_moon_info(frame_start, loc, label):
@@ -226,8 +362,8 @@ def debug_print_moon_info(frame_start, loc, label):
         print(f"[DEBUG {label}] Swiss Ephemeris nicht verfügbar – Moon/Lahiri-Fallback aktiv.")
         return
 
-    nak_index = int(moon_lon / NAKSHATRA_SIZE)
-    lord = DASHA_ORDER[nak_index % len(DASHA_ORDER)]
+    nak_index = int(moon_lon * _NAK_SCALE)
+    lord = _NAK_TO_LORD[nak_index]
     print(
         f"[DEBUG {label}] Moon(Lahiri) = {moon_lon:.4f}° | "
         f"Nakshatra-Index = {nak_index} | Start-Lord = {lord}"
@@ -441,7 +577,8 @@ def build_kp_keno_timedasha_payload(date):
     """
     Baut eine schlanke, KENO-taugliche Struktur:
     YEAR / MONTH / WEEK -> Levels -> Lord + Restlaufzeit (Sekunden)
-    + Restanteil (0..1). Datumsangaben als ISO-Strings.
+    + Restanteil (0..1). Datumsangaben bleiben datetime-Objekte;
+    die ISO-Darstellung erfolgt erst beim Serialisieren (dumps_payload).
     """
     raw = build_kp_keno_timedasha(date)
     payload = {}
@@ -449,8 +586,8 @@ def build_kp_keno_timedasha_payload(date):
     for block in raw:
         frame = block["frame"]
         frame_entry = {
-            "start": block["start"].isoformat(),
-            "end": block["end"].isoformat(),
+            "start": block["start"],
+            "end": block["end"],
             "start_lord": block["start_lord"],
             "levels": {}
         }
@@ -461,8 +598,8 @@ def build_kp_keno_timedasha_payload(date):
 
             frame_entry["levels"][lvl_name] = {
                 "lord": info["lord"],
-                "start": info["start"].isoformat(),
-                "end": info["end"].isoformat(),
+                "start": info["start"],
+                "end": info["end"],
                 "remaining_seconds": remaining_sec,
                 "remaining_fraction": remaining_frac,
             }
@@ -472,6 +609,26 @@ def build_kp_keno_timedasha_payload(date):
     return payload
 
 
+def _json_default(obj):
+    """Fallback-Serializer für json: datetime -> ISO-String."""
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    raise TypeError(f"Nicht serialisierbar: {type(obj).__name__}")
+
+
+def dumps_payload(payload):
+    """
+    Serialisiert den Payload als eingerückten JSON-String.
+    Nutzt orjson (datetime nativ), sonst json mit ISO-Fallback.
+    """
+    if HAVE_ORJSON:
+        return orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC,
+        ).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2, default=_json_default)
+
+
 # ---------------------------------------------------------
 # CLI-Einstieg
 # ---------------------------------------------------------
@@ -505,21 +662,21 @@ if __name__ == "__main__":
 
     if use_json:
         payload = build_kp_keno_timedasha_payload(date)
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print(dumps_payload(payload))
     else:
         data = build_kp_keno_timedasha(date)
         print(f"KP-KENO-TIMEDASHA für Datum: {date}")
 
         for block in data:
             print("\n====", block["frame"], "====")
-            frame_start_str = block["start"].strftime('%Y-%m-%d %H:%M')
-            frame_end_str = block["end"].strftime('%Y-%m-%d %H:%M')
+            frame_start_str = _fmt_min(block["start"])
+            frame_end_str = _fmt_min(block["end"])
             print(f"Frame: {frame_start_str}  →  {frame_end_str}")
             print(f"Start-Lord (Moon/Lahiri): {block['start_lord']}")
 
             for lvl, info in block["levels"].items():
                 # Endzeit ohne Sekunden
-                end_str = info["end"].strftime("%Y-%m-%d %H:%M")
+                end_str = _fmt_min(info["end"])
 
                 # Restlaufzeit ohne Sekunden
                 rem = info["remaining"]
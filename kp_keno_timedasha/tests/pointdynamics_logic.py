@@ -5,13 +5,26 @@
 from typing import List, Dict, Any
 import math
 
+import numpy as np
+
 # -----------------------------
 # Hilfsfunktion
 # -----------------------------
-def _to_list(x: Any) -> List[float]:
-    if isinstance(x, list):
-        return [float(v) for v in x]
-    return []
+def _as_array(x: Any) -> np.ndarray:
+    """
+    Einmalige, typisierte Konvertierung in ein 1D-float64-Array.
+    None -> leere Serie (wie früher _to_list). Ungültige Werte -> ValueError,
+    nicht TypeError: den fängt _execute_tool_locally als Signaturfehler ab.
+    """
+    if x is None:
+        return np.empty(0, dtype=np.float64)
+    try:
+        a = np.asarray(x, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"values müssen numerisch sein: {e}") from e
+    if a.ndim != 1:
+        raise ValueError(f"values müssen eindimensional sein (ndim={a.ndim})")
+    return a
 
 # -----------------------------
 # 1) RATE – Erste Ableitung
@@ -52,27 +65,34 @@ def pd_impact(acc: List[float], threshold: float = 1.0) -> List[int]:
 # -----------------------------
 # 5) FULL PIPELINE – Komplettanalyse
 # -----------------------------
-def pd_full_pipeline(values: Any) -> Dict:
-    """Die komplette ursprüngliche Analyse-Pipeline."""
-    vals = _to_list(values)
+def pd_full_pipeline(values: Any, debug: bool = False) -> Dict:
+    """
+    Die komplette ursprüngliche Analyse-Pipeline.
+    debug=True hängt einen Debug-Block an, der dieselben Listen
+    referenziert (keine Kopien, alte Schlüssel values_raw/impact).
+    """
+    # Listen-Ausgabe für JSON-Aufrufer: einmalig via tolist() (C-Schleife)
+    vals = _as_array(values).tolist()
     rate = pd_rate(vals)
     vel = pd_velocity(rate)
     acc = pd_acceleration(rate)
     impact = pd_impact(acc)
 
-    return {
+    out = {
         "DynamicsUnits": {
             "values": vals,
             "rate": rate,
             "velocity": vel,
             "acceleration": acc,
             "impact_zones": impact
-        },
-        "debug": {
+        }
+    }
+    if debug:
+        out["debug"] = {
             "values_raw": vals,
             "rate": rate,
             "velocity": vel,
             "acceleration": acc,
             "impact": impact
         }
-    }
+    return out
@@ -1,6 +1,14 @@
 import os
 import datetime
-from run_timedasha import build_kp_keno_timedasha
+from concurrent.futures import ProcessPoolExecutor
+from run_timedasha import (
+    build_kp_keno_timedasha,
+    get_wiesbaden_location,
+    prefetch_sunrises,
+    _fmt_min,
+    swe,
+    HAVE_SWISSEPH,
+)
 
 # ---------------------------------------------------------
 # Speicherort für das Logbuch
@@ -22,7 +30,7 @@ def get_log_path():
 # ---------------------------------------------------------
 
 def format_level(name, info):
-    end_str = info["end"].strftime("%Y-%m-%d %H:%M")
+    end_str = _fmt_min(info["end"])
 
     rem = info["remaining"]
     rem_days = rem.days
@@ -51,8 +59,8 @@ def build_log_entry(date):
 
     for block in data:
         frame = block["frame"]
-        frame_start = block["start"].strftime("%Y-%m-%d %H:%M")
-        frame_end = block["end"].strftime("%Y-%m-%d %H:%M")
+        frame_start = _fmt_min(block["start"])
+        frame_end = _fmt_min(block["end"])
 
         out.append(f"---- {frame} FRAME ----")
         out.append(f"Start-Lord: {block['start_lord']}")
@@ -74,16 +82,56 @@ def build_log_entry(date):
 # Speichern im Textlog
 # ---------------------------------------------------------
 
-def append_log_entry(date):
-    entry = build_log_entry(date)
+LOG_WRITE_BUFFER = 65536  # 64 KiB
+
+
+def append_log_entries(dates):
+    """
+    Schreibt Einträge für mehrere Daten in einem Durchgang:
+    Datei wird nur einmal (gepuffert) geöffnet, alle benötigten
+    Sonnenaufgänge werden vorab gesammelt berechnet.
+    """
+    dates = list(dates)
+    prefetch_sunrises(dates, get_wiesbaden_location())
+    path = get_log_path()
+
+    with open(path, "a", encoding="utf-8", buffering=LOG_WRITE_BUFFER) as f:
+        for date in dates:
+            f.write(build_log_entry(date))
+
+    return path
+
+
+def _init_worker(ephe_path):
+    """Worker-Initialisierung: Swiss-Ephemeris-Datenpfad pro Prozess setzen."""
+    if HAVE_SWISSEPH:
+        swe.set_ephe_path(ephe_path)
+
+
+def append_log_entries_parallel(dates, workers=None, ephe_path=None):
+    """
+    Wie append_log_entries, aber die Einträge werden parallel in
+    Worker-Prozessen berechnet (Ephemeris-Rechnung ist CPU-gebunden)
+    und anschließend in Datumsreihenfolge seriell geschrieben.
+    """
+    dates = list(dates)
     path = get_log_path()
 
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(entry)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(ephe_path,),
+    ) as ex, open(path, "a", encoding="utf-8", buffering=LOG_WRITE_BUFFER) as f:
+        for entry in ex.map(build_log_entry, dates, chunksize=32):
+            f.write(entry)
 
     return path
 
 
+def append_log_entry(date):
+    return append_log_entries([date])
+
+
 # ---------------------------------------------------------
 # MAIN
 # ---------------------------------------------------------
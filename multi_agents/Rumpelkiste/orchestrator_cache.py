@@ -0,0 +1,149 @@
+"""
+orchestrator_cache.py – Exakter Antwort-Cache für den Saham-Lab Orchestrator
+
+- cache_key: sha256 über Modell, Nachrichten, Temperatur und Tools
+- LLMCache:  LRU (OrderedDict) mit TTL, thread-sicher
+- SemanticCache: Treffer auch für nahezu gleiche Prompts (lokale Embeddings,
+  optional: sentence-transformers)
+
+Nur für deterministische Läufe sinnvoll (gleicher Prompt -> gleiche Antwort).
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+# NumPy (optional, Embedding-Index des SemanticCache)
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# sentence-transformers (optional, lokale Embeddings für SemanticCache)
+try:
+    from sentence_transformers import SentenceTransformer
+    HAVE_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    SentenceTransformer = None
+    HAVE_SENTENCE_TRANSFORMERS = False
+
+
+def cache_key(
+    model: str,
+    messages: List[Any],
+    temperature: Optional[float] = None,
+    tools: Optional[List[Any]] = None,
+) -> str:
+    """Stabiler Hash eines Completion-Aufrufs (kanonisches JSON)."""
+    raw = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature, "tools": tools},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    In-Memory-LRU mit Ablaufzeit je Eintrag.
+    get liefert None bei Miss oder abgelaufenem Eintrag.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if time.monotonic() >= expires:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache:
+    """
+    Antwort-Cache über Kosinus-Ähnlichkeit normierter Prompt-Embeddings:
+    Treffer, wenn der ähnlichste gespeicherte Prompt >= threshold liegt.
+    Index = ein (n, d)-Array, Lookup = ein Matrix-Vektor-Produkt.
+    Älteste Einträge fallen bei mehr als maxsize heraus (FIFO).
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.92,
+        maxsize: int = 1024,
+    ):
+        if not (HAVE_SENTENCE_TRANSFORMERS and HAVE_NUMPY):
+            raise RuntimeError("sentence-transformers/numpy ist nicht installiert (SemanticCache).")
+        self.model_name = model_name
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._model = None
+        self._index = None
+        self._responses: List[Any] = []
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str):
+        # Modell erst beim ersten Zugriff laden
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        vec = self._model.encode([text], normalize_embeddings=True)[0]
+        return np.asarray(vec, dtype=np.float32)
+
+    def get(self, text: str) -> Any:
+        q = self._embed(text)
+        with self._lock:
+            if self._index is None:
+                return None
+            sims = self._index @ q
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            return self._responses[best]
+
+    def set(self, text: str, value: Any) -> None:
+        vec = self._embed(text)[None, :]
+        with self._lock:
+            self._index = vec if self._index is None else np.vstack((self._index, vec))
+            self._responses.append(value)
+            if len(self._responses) > self.maxsize:
+                self._index = self._index[1:]
+                self._responses.pop(0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = None
+            self._responses.clear()
+
+    def __len__(self) -> int:
+        return len(self._responses)
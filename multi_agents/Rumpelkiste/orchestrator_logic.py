@@ -3,7 +3,8 @@ Orchestrator 0.5 – Mode C (Samy-Power, voll-autonom)
 ----------------------------------------------------
 
 Features:
-- Agent-Registry (TemporalSynth, PatternCore, StructureWeaver, PointEngine, PointDynamics)
+- Agent-Registry (TemporalSynth, PatternCore, StructureWeaver, PointEngine, PointDynamics,
+  CoherenceAgent, AnomalyAgent) – datengetrieben über _AGENT_CLASSES
 - Sanity 1.0 (guardian_gate): operative Gates vor/nach Agenten
 - Sanity 2.0 (diagnostic_core): optionale Diagnoseebene
 - Hybrid-Modus:
@@ -11,9 +12,21 @@ Features:
     - Orchestrator entscheidet, wie weitergemacht wird (Mode C)
 - Convenience-Methoden für häufige Pipelines
 - Task-Interface (submit/run_task/run_queue) – einfache Multi-Task-Schicht
+- Async-Queue (run_task_async/run_queue_async) – Tasks laufen nebenläufig
+- Prozess-Pool (run_queue(parallel=True)) – CPU-lastige Tasks auf mehreren Kernen
+- Celery-Backend (optional, submit(..., backend="celery")) – verteilte Worker
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 try:
     # Paketvariante
@@ -22,8 +35,10 @@ try:
     from multi_agents.structureweaver import StructureWeaver
     from multi_agents.pointengine import PointEngine
     from multi_agents.pointdynamics import PointDynamics
+    from multi_agents.coherence_agent import CoherenceAgent
+    from multi_agents.anomaly_agent import AnomalyAgent
     from multi_agents.guardian_gate import (
-        gate_array_input,
+        gate_array_input_v2,
         gate_multiagent_input,
         gate_agent_output,
     )
@@ -35,13 +50,132 @@ except ImportError:
     from structureweaver import StructureWeaver
     from pointengine import PointEngine
     from pointdynamics import PointDynamics
+    from coherence_agent import CoherenceAgent
+    from anomaly_agent import AnomalyAgent
     from guardian_gate import (
-        gate_array_input,
+        gate_array_input_v2,
         gate_multiagent_input,
         gate_agent_output,
     )
     from diagnostic_core import full_diagnostic
 
+# Celery (optional, verteilte Task-Queue)
+try:
+    from celery import Celery
+    HAVE_CELERY = True
+except ImportError:
+    Celery = None
+    HAVE_CELERY = False
+
+
+# Defaults für run_task-Payloads (werden in die generierten
+# Dispatch-Funktionen eingebacken, siehe _build_dispatch)
+_TASK_DEFAULTS: Dict[str, Any] = {
+    "seq": (),
+    "pre_validated": False,
+    "with_debug": True,
+    "with_diagnostics": True,
+}
+
+# Agent-Registry: (name, Klasse) in Registrierungsreihenfolge
+_AGENT_CLASSES: List[tuple] = [
+    ("temporalsynth", TemporalSynth),
+    ("patterncore", PatternCore),
+    ("structureweaver", StructureWeaver),
+    ("pointengine", PointEngine),
+    ("pointdynamics", PointDynamics),
+    ("coherence", CoherenceAgent),
+    ("anomaly", AnomalyAgent),
+]
+
+# Queue-Kinds, die eine einzelne Sequenz an einen Agenten geben:
+# kind -> (agent_name, task_name)
+_SEQ_TASK_KINDS: Dict[str, tuple] = {
+    "patterncore_summary": ("patterncore", "pattern_summary"),
+    "structureweaver_summary": ("structureweaver", "structure_summary"),
+    "pointengine_summary": ("pointengine", "point_summary"),
+    "pointdynamics_full": ("pointdynamics", "dynamics_full"),
+}
+
+
+# Ergebniswrapper: geteilte leere Warnliste + Meta-Vorlage
+_EMPTY_WARNINGS: tuple = ()
+_META_TEMPLATE: Dict[str, Any] = {
+    "orchestrator_version": None,
+    "agent": None,
+    "task": None,
+}
+
+# Größe des LRU-Ergebnis-Caches für die Sequenz-Agenten
+RESULT_CACHE_SIZE = 1024
+
+
+# Elementtypen, deren repr() Wert und Typ eindeutig abbildet (1, 1.0, True)
+_CACHEABLE_ELEM_TYPES = frozenset((int, float, bool, str, type(None)))
+
+
+def _seq_cache_key(
+    agent_name: str, task_name: str, seq: Any, pre_validated: bool
+) -> Optional[tuple]:
+    """
+    Cache-Key für reine Sequenz-Tasks; None, wenn seq nicht cachebar ist.
+    Statt einer Kopie von seq hält der Key einen 16-Byte-Digest über repr(seq).
+    pre_validated gehört dazu, da es über die Gate-Warnings im Ergebnis entscheidet.
+    """
+    if not isinstance(seq, (list, tuple)):
+        return None
+    if not _CACHEABLE_ELEM_TYPES.issuperset(map(type, seq)):
+        return None
+    digest = hashlib.blake2b(repr(seq).encode(), digest_size=16).digest()
+    return (agent_name, task_name, pre_validated, digest)
+
+
+def _as_seq(x: Any) -> Any:
+    """list/tuple unverändert durchreichen, alles andere einmal materialisieren."""
+    return x if isinstance(x, (list, tuple)) else list(x)
+
+
+class _LazyDiagnostic(Mapping):
+    """
+    Diagnose-Paket, das erst beim ersten Zugriff berechnet wird.
+    Aufrufer, die nur "result" lesen, zahlen full_diagnostic nicht.
+    Da die Berechnung nachgelagert ist, landen Fehler in full_diagnostic
+    als {"ok": False, ...} im Paket statt in den warnings.
+    Für JSON: dict(res["diagnostics"]).
+    """
+
+    __slots__ = ("_factory", "_cached")
+
+    def __init__(self, factory: Callable[[], Dict[str, Any]]) -> None:
+        self._factory = factory
+        self._cached: Optional[Dict[str, Any]] = None
+
+    def _materialize(self) -> Dict[str, Any]:
+        if self._cached is None:
+            try:
+                self._cached = self._factory()
+            except Exception as e:
+                self._cached = {
+                    "ok": False,
+                    "source": "diagnostic_core",
+                    "reason": "Exception in full_diagnostic",
+                    "exception": str(e),
+                }
+            self._factory = None
+        return self._cached
+
+    def __getitem__(self, key: str) -> Any:
+        return self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
 
 class Orchestrator:
     """
@@ -54,10 +188,33 @@ class Orchestrator:
     - einfache Task-Queue integriert.
     """
 
-    def __init__(self, version: str = "0.5-modeC") -> None:
+    def __init__(
+        self,
+        version: str = "0.5-modeC",
+        *,
+        max_queue: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
         self.version = version
-        self.agents: Dict[str, Any] = {}
-        self.tasks: List[Dict[str, Any]] = []  # simple in-memory queue
+        # Backpressure: Obergrenze der Queue (None = unbegrenzt) und der
+        # gleichzeitig laufenden Tasks in run_queue_async (None = unbegrenzt)
+        self.max_queue = max_queue
+        self.max_concurrency = max_concurrency
+        self._agent_factories: Dict[str, Callable[[], Any]] = {}
+        self._agent_instances: Dict[str, Any] = {}
+        self.tasks: Deque[Dict[str, Any]] = deque()  # simple in-memory queue (O(1) popleft)
+
+        self._pool: Optional[ProcessPoolExecutor] = None  # lazy, persistent
+        self._pool_workers = 0
+
+        # LRU-Cache für Sequenz-Agenten (reine Funktionen von seq)
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
+        # kind -> gebundene, generierte Dispatch-Methode (siehe _build_dispatch)
+        self._task_dispatch: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            kind: getattr(self, "_dispatch_" + kind) for kind in _TASK_KINDS
+        }
 
         self._register_default_agents()
 
@@ -65,41 +222,48 @@ class Orchestrator:
     # Agent-Registry
     # ------------------------------------------------------------------
     def _register_default_agents(self) -> None:
-        errors: Dict[str, Any] = {}
+        """
+        Registriert nur die Klassen; Instanzen entstehen lazy beim ersten
+        Zugriff (_get_agent), damit ungenutzte Agenten nichts kosten.
+        """
+        self._agent_factories = dict(_AGENT_CLASSES)
 
-        try:
-            self.agents["temporalsynth"] = TemporalSynth()
-        except Exception as e:
-            errors["temporalsynth"] = e
+        # Konstruktionsfehler intern merken (könnten später geloggt werden)
+        self.agent_errors: Dict[str, Any] = {}
 
-        try:
-            self.agents["patterncore"] = PatternCore()
-        except Exception as e:
-            errors["patterncore"] = e
+        # gebundene .run-Methoden, einmal pro Instanz aufgelöst (None = keine .run())
+        self._agent_run: Dict[str, Optional[Callable[..., Any]]] = {}
 
-        try:
-            self.agents["structureweaver"] = StructureWeaver()
-        except Exception as e:
-            errors["structureweaver"] = e
+    def _get_agent(self, name: str) -> Optional[Any]:
+        """Agent-Instanz (beim ersten Zugriff erzeugt) oder None."""
+        inst = self._agent_instances.get(name)
+        if inst is not None:
+            return inst
 
-        try:
-            self.agents["pointengine"] = PointEngine()
-        except Exception as e:
-            errors["pointengine"] = e
+        factory = self._agent_factories.get(name)
+        if factory is None or name in self.agent_errors:
+            return None
 
         try:
-            self.agents["pointdynamics"] = PointDynamics()
+            inst = factory()
         except Exception as e:
-            errors["pointdynamics"] = e
+            self.agent_errors[name] = e
+            return None
 
-        # Fehler intern merken (könnten später geloggt werden)
-        self.agent_errors = errors
+        self._agent_instances[name] = inst
+        self._agent_run[name] = getattr(inst, "run", None)
+        return inst
+
+    @property
+    def agents(self) -> Dict[str, Any]:
+        """Bisher instanziierte Agenten."""
+        return self._agent_instances
 
     def list_agents(self) -> List[str]:
-        return [k for k in self.agents.keys()]
+        return [k for k in self._agent_factories if k not in self.agent_errors]
 
     def has_agent(self, name: str) -> bool:
-        return name in self.agents
+        return name in self._agent_factories and name not in self.agent_errors
 
     # ------------------------------------------------------------------
     # Ergebniswrapper
@@ -110,20 +274,24 @@ class Orchestrator:
         ok: bool,
         result: Any,
         warnings: List[Dict[str, Any]],
-        diagnostics: Optional[Dict[str, Any]] = None,
+        diagnostics: Optional[Mapping[str, Any]] = None,
         agent: Optional[str] = None,
         task: Optional[str] = None,
     ) -> Dict[str, Any]:
+        """
+        Einheitliches Ergebnisformat. Ohne Warnings wird das geteilte
+        leere Tupel _EMPTY_WARNINGS eingesetzt (nicht anhängen!).
+        """
+        meta = _META_TEMPLATE.copy()
+        meta["orchestrator_version"] = self.version
+        meta["agent"] = agent
+        meta["task"] = task
         return {
             "ok": ok,
             "result": result,
-            "warnings": warnings,
+            "warnings": warnings or _EMPTY_WARNINGS,
             "diagnostics": diagnostics,
-            "meta": {
-                "orchestrator_version": self.version,
-                "agent": agent,
-                "task": task,
-            },
+            "meta": meta,
         }
 
     # ------------------------------------------------------------------
@@ -140,7 +308,7 @@ class Orchestrator:
         with_diagnostics: bool = True,
     ) -> Dict[str, Any]:
         warnings: List[Dict[str, Any]] = []
-        diagnostics: Optional[Dict[str, Any]] = None
+        diagnostics: Optional[Mapping[str, Any]] = None
         agent_name = "temporalsynth"
         task_name = "temporal_full"
 
@@ -166,7 +334,8 @@ class Orchestrator:
                 }
             )
 
-        if not self.has_agent(agent_name):
+        agent = self._get_agent(agent_name)
+        if agent is None:
             warnings.append(
                 {
                     "source": "orchestrator",
@@ -183,7 +352,7 @@ class Orchestrator:
                 task=task_name,
             )
 
-        ts: TemporalSynth = self.agents[agent_name]  # type: ignore[assignment]
+        ts: TemporalSynth = agent
 
         # Agent-Aufruf
         try:
@@ -226,25 +395,17 @@ class Orchestrator:
 
         # Optional: Diagnostics 2.0
         if with_diagnostics and isinstance(out, dict):
-            try:
-                diagnostics = full_diagnostic(
+            diagnostics = _LazyDiagnostic(
+                lambda: full_diagnostic(
                     agent=agent_name,
                     task=task_name,
                     output=out,
-                    patterns=list(patterns),
-                    structures=list(structures),
-                    points=list(points),
-                    motion=list(motion),
-                )
-            except Exception as e:
-                warnings.append(
-                    {
-                        "source": "diagnostic_core",
-                        "where": "call",
-                        "reason": "Exception in full_diagnostic",
-                        "exception": str(e),
-                    }
+                    patterns=_as_seq(patterns),
+                    structures=_as_seq(structures),
+                    points=_as_seq(points),
+                    motion=_as_seq(motion),
                 )
+            )
 
         return self._wrap(
             ok=True,
@@ -265,22 +426,75 @@ class Orchestrator:
         task_name: str,
         seq: Any,
         with_diagnostics: bool = False,
+        pre_validated: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Sequenz-Task mit LRU-Cache. Ohne Diagnostics ist das Ergebnis eine
+        reine Funktion von (agent, task, seq, pre_validated); Treffer werden
+        als tiefe Kopie geliefert, damit Aufrufer den Cache nicht verändern.
+
+        pre_validated=True: Aufrufer hat seq bereits als numerische Sequenz
+        erkannt (z.B. detect_input_type -> "sequence"); das Input-Gate entfällt.
+        """
+        key = (
+            None
+            if with_diagnostics
+            else _seq_cache_key(agent_name, task_name, seq, pre_validated)
+        )
+
+        if key is not None:
+            with self._result_cache_lock:
+                hit = self._result_cache.get(key)
+                if hit is not None:
+                    self._result_cache.move_to_end(key)
+            if hit is not None:
+                return copy.deepcopy(hit)
+
+        res = self._execute_simple_agent_on_seq(
+            agent_name=agent_name,
+            task_name=task_name,
+            seq=seq,
+            with_diagnostics=with_diagnostics,
+            pre_validated=pre_validated,
+        )
+
+        if key is not None and res["ok"]:
+            cached = copy.deepcopy(res)
+            with self._result_cache_lock:
+                self._result_cache[key] = cached
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        return res
+
+    def _execute_simple_agent_on_seq(
+        self,
+        *,
+        agent_name: str,
+        task_name: str,
+        seq: Any,
+        with_diagnostics: bool = False,
+        pre_validated: bool = False,
     ) -> Dict[str, Any]:
         warnings: List[Dict[str, Any]] = []
-        diagnostics: Optional[Dict[str, Any]] = None
+        diagnostics: Optional[Mapping[str, Any]] = None
 
-        gate_in = gate_array_input(seq, agent=agent_name, task=task_name)
-        if not gate_in["ok"]:
-            warnings.append(
-                {
-                    "source": "guardian_gate",
-                    "where": gate_in["where"],
-                    "reason": gate_in["reason"],
-                    "details": gate_in.get("details", {}),
-                }
-            )
+        if pre_validated:
+            data = seq
+        else:
+            gate_in, data = gate_array_input_v2(seq, agent=agent_name, task=task_name)
+            if not gate_in["ok"]:
+                warnings.append(
+                    {
+                        "source": "guardian_gate",
+                        "where": gate_in["where"],
+                        "reason": gate_in["reason"],
+                        "details": gate_in.get("details", {}),
+                    }
+                )
 
-        if not self.has_agent(agent_name):
+        agent = self._get_agent(agent_name)
+        if agent is None:
             warnings.append(
                 {
                     "source": "orchestrator",
@@ -297,9 +511,8 @@ class Orchestrator:
                 task=task_name,
             )
 
-        agent = self.agents[agent_name]
-
-        if not hasattr(agent, "run"):
+        run = self._agent_run.get(agent_name)
+        if run is None:
             warnings.append(
                 {
                     "source": "orchestrator",
@@ -317,7 +530,7 @@ class Orchestrator:
             )
 
         try:
-            out = agent.run(task_name, {"data": seq})
+            out = run(task_name, {"data": data})
         except Exception as e:
             warnings.append(
                 {
@@ -348,21 +561,13 @@ class Orchestrator:
             )
 
         if with_diagnostics and isinstance(out, dict):
-            try:
-                diagnostics = full_diagnostic(
+            diagnostics = _LazyDiagnostic(
+                lambda: full_diagnostic(
                     agent=agent_name,
                     task=task_name,
                     output=out,
                 )
-            except Exception as e:
-                warnings.append(
-                    {
-                        "source": "diagnostic_core",
-                        "where": "call",
-                        "reason": "Exception in full_diagnostic",
-                        "exception": str(e),
-                    }
-                )
+            )
 
         return self._wrap(
             ok=True,
@@ -374,39 +579,67 @@ class Orchestrator:
         )
 
     # PatternCore
-    def patterncore_summary(self, seq: Any, *, with_diagnostics: bool = False) -> Dict[str, Any]:
+    def patterncore_summary(
+        self,
+        seq: Any,
+        *,
+        with_diagnostics: bool = False,
+        pre_validated: bool = False,
+    ) -> Dict[str, Any]:
         return self._run_simple_agent_on_seq(
             agent_name="patterncore",
             task_name="pattern_summary",
             seq=seq,
             with_diagnostics=with_diagnostics,
+            pre_validated=pre_validated,
         )
 
     # StructureWeaver
-    def structureweaver_summary(self, seq: Any, *, with_diagnostics: bool = False) -> Dict[str, Any]:
+    def structureweaver_summary(
+        self,
+        seq: Any,
+        *,
+        with_diagnostics: bool = False,
+        pre_validated: bool = False,
+    ) -> Dict[str, Any]:
         return self._run_simple_agent_on_seq(
             agent_name="structureweaver",
             task_name="structure_summary",
             seq=seq,
             with_diagnostics=with_diagnostics,
+            pre_validated=pre_validated,
         )
 
     # PointEngine
-    def pointengine_summary(self, seq: Any, *, with_diagnostics: bool = False) -> Dict[str, Any]:
+    def pointengine_summary(
+        self,
+        seq: Any,
+        *,
+        with_diagnostics: bool = False,
+        pre_validated: bool = False,
+    ) -> Dict[str, Any]:
         return self._run_simple_agent_on_seq(
             agent_name="pointengine",
             task_name="point_summary",
             seq=seq,
             with_diagnostics=with_diagnostics,
+            pre_validated=pre_validated,
         )
 
     # PointDynamics
-    def pointdynamics_full(self, seq: Any, *, with_diagnostics: bool = False) -> Dict[str, Any]:
+    def pointdynamics_full(
+        self,
+        seq: Any,
+        *,
+        with_diagnostics: bool = False,
+        pre_validated: bool = False,
+    ) -> Dict[str, Any]:
         return self._run_simple_agent_on_seq(
             agent_name="pointdynamics",
             task_name="dynamics_full",
             seq=seq,
             with_diagnostics=with_diagnostics,
+            pre_validated=pre_validated,
         )
 
     # ------------------------------------------------------------------
@@ -425,9 +658,10 @@ class Orchestrator:
         Erwartet, dass der Agent eine .run(task, payload)-Methode hat.
         """
         warnings: List[Dict[str, Any]] = []
-        diagnostics: Optional[Dict[str, Any]] = None
+        diagnostics: Optional[Mapping[str, Any]] = None
 
-        if not self.has_agent(agent_name):
+        agent = self._get_agent(agent_name)
+        if agent is None:
             warnings.append(
                 {
                     "source": "orchestrator",
@@ -444,8 +678,8 @@ class Orchestrator:
                 task=task_name,
             )
 
-        agent = self.agents[agent_name]
-        if not hasattr(agent, "run"):
+        run = self._agent_run.get(agent_name)
+        if run is None:
             warnings.append(
                 {
                     "source": "orchestrator",
@@ -463,7 +697,7 @@ class Orchestrator:
             )
 
         try:
-            out = agent.run(task_name, payload)  # type: ignore[call-arg]
+            out = run(task_name, payload)
         except Exception as e:
             warnings.append(
                 {
@@ -494,21 +728,13 @@ class Orchestrator:
             )
 
         if with_diagnostics and isinstance(out, dict):
-            try:
-                diagnostics = full_diagnostic(
+            diagnostics = _LazyDiagnostic(
+                lambda: full_diagnostic(
                     agent=agent_name,
                     task=task_name,
                     output=out,
                 )
-            except Exception as e:
-                warnings.append(
-                    {
-                        "source": "diagnostic_core",
-                        "where": "call",
-                        "reason": "Exception in full_diagnostic",
-                        "exception": str(e),
-                    }
-                )
+            )
 
         return self._wrap(
             ok=True,
@@ -519,10 +745,30 @@ class Orchestrator:
             task=task_name,
         )
 
+    # ------------------------------------------------------------------
+    # Batch-Schnittstelle (gleichartige Tasks)
+    # ------------------------------------------------------------------
+    def run_batch(self, kind: str, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Führt viele Tasks gleicher Art aus – je Payload wie run_task (gleiches
+        Input-Gate, Ergebnis-Cache und ok-Verhalten), der Dispatch wird nur
+        einmal aufgelöst. Ergebnisse in Payload-Reihenfolge.
+        """
+        fn = self._task_dispatch.get(kind)
+        if fn is None:
+            return [self.run_task(kind, pl) for pl in payloads]
+        return [fn(pl) for pl in payloads]
+
     # ------------------------------------------------------------------
     # Einfache Task-Queue (Multitask-Layer)
     # ------------------------------------------------------------------
-    def submit(self, kind: str, payload: Dict[str, Any]) -> None:
+    def submit(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        *,
+        backend: str = "local",
+    ) -> Optional[str]:
         """
         Fügt eine Aufgabe in die interne Queue ein.
         kind:
@@ -531,32 +777,56 @@ class Orchestrator:
             - "structureweaver_summary"
             - "pointengine_summary"
             - "pointdynamics_full"
+
+        backend="celery": Aufgabe geht an die Celery-Worker statt in die
+        lokale Queue; Rückgabe ist die Task-ID (Status: task_status()).
+        """
+        if backend == "celery":
+            if not HAVE_CELERY:
+                raise RuntimeError("Celery ist nicht installiert (backend='celery').")
+            return run_agent_task.delay(kind, payload, self.version).id
+
+        if not self.submit_nowait(kind, payload):
+            raise RuntimeError(f"Task-Queue voll (max_queue={self.max_queue}).")
+        return None
+
+    def submit_nowait(self, kind: str, payload: Dict[str, Any]) -> bool:
         """
+        Wie submit (lokale Queue), aber ohne Exception:
+        False, wenn die Queue max_queue erreicht hat.
+        """
+        if self.max_queue is not None and len(self.tasks) >= self.max_queue:
+            return False
         self.tasks.append(
             {
                 "kind": kind,
                 "payload": payload,
             }
         )
+        return True
+
+    @staticmethod
+    def task_status(task_id: str) -> Dict[str, Any]:
+        """
+        Status einer per Celery eingereichten Aufgabe.
+        result ist erst bei state == "SUCCESS" gesetzt.
+        """
+        if not HAVE_CELERY:
+            raise RuntimeError("Celery ist nicht installiert (backend='celery').")
+        res = celery_app.AsyncResult(task_id)
+        return {
+            "task_id": task_id,
+            "state": res.state,
+            "result": res.result if res.successful() else None,
+        }
 
     def run_task(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Führt eine einzelne Aufgabe aus, ohne Queue.
         """
-        if kind == "temporal_full":
-            return self.temporal_full(**payload)
-
-        if kind == "patterncore_summary":
-            return self.patterncore_summary(payload.get("seq", []))
-
-        if kind == "structureweaver_summary":
-            return self.structureweaver_summary(payload.get("seq", []))
-
-        if kind == "pointengine_summary":
-            return self.pointengine_summary(payload.get("seq", []))
-
-        if kind == "pointdynamics_full":
-            return self.pointdynamics_full(payload.get("seq", []))
+        fn = self._task_dispatch.get(kind)
+        if fn is not None:
+            return fn(payload)
 
         return self._wrap(
             ok=False,
@@ -573,19 +843,170 @@ class Orchestrator:
             task=kind,
         )
 
-    def run_queue(self) -> List[Dict[str, Any]]:
+    async def run_task_async(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wie run_task, aber im Worker-Thread – blockiert den Event-Loop nicht.
+        """
+        return await asyncio.to_thread(self.run_task, kind, payload)
+
+    async def run_queue_async(self) -> List[Dict[str, Any]]:
+        """
+        Führt alle Aufgaben in der Queue nebenläufig aus (asyncio.gather).
+        Ergebnisse in Submit-Reihenfolge; die Queue wird geleert.
+        Mit max_concurrency laufen höchstens so viele Tasks gleichzeitig.
         """
-        Führt alle Aufgaben in der Queue nacheinander aus.
-        Gibt die Liste der Ergebnisse zurück und leert die Queue.
+        jobs = [self.tasks.popleft() for _ in range(len(self.tasks))]
+
+        if self.max_concurrency is None:
+            coros = (self.run_task_async(job["kind"], job["payload"]) for job in jobs)
+        else:
+            sem = asyncio.Semaphore(self.max_concurrency)
+
+            async def _bounded(job: Dict[str, Any]) -> Dict[str, Any]:
+                async with sem:
+                    return await self.run_task_async(job["kind"], job["payload"])
+
+            coros = (_bounded(job) for job in jobs)
+
+        return list(await asyncio.gather(*coros))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool_workers = os.cpu_count() or 1
+            # fork (wo verfügbar) startet Worker ohne Re-Import – deutlich
+            # schneller als spawn
+            ctx = (
+                multiprocessing.get_context("fork")
+                if "fork" in multiprocessing.get_all_start_methods()
+                else None
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._pool_workers,
+                mp_context=ctx,
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Fährt den Prozess-Pool (falls gestartet) herunter."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def run_queue(self, *, parallel: bool = False) -> List[Dict[str, Any]]:
+        """
+        Führt alle Aufgaben in der Queue aus. Gibt die Liste der Ergebnisse
+        zurück und leert die Queue.
+
+        parallel=False: synchroner Wrapper um run_queue_async (Threads).
+        parallel=True:  persistenter Prozess-Pool für CPU-lastige Agenten;
+                        Payloads müssen picklebar sein.
         """
-        results: List[Dict[str, Any]] = []
-        while self.tasks:
-            job = self.tasks.pop(0)
-            k = job["kind"]
-            pl = job["payload"]
-            res = self.run_task(k, pl)
-            results.append(res)
-        return results
+        if not parallel:
+            return asyncio.run(self.run_queue_async())
+
+        pool = self._get_pool()
+        jobs = [
+            (job["kind"], job["payload"], self.version)
+            for job in (self.tasks.popleft() for _ in range(len(self.tasks)))
+        ]
+        # mehrere Tasks pro IPC-Roundtrip, aber genug Chunks für Lastausgleich
+        chunksize = max(1, len(jobs) // (self._pool_workers * 4 + 2))
+        return list(pool.map(_dispatch_tuple, jobs, chunksize=chunksize))
+
+
+# ---------------------------------------------------------------------------
+# Generierte Dispatch-Methoden (eine pro Task-Kind)
+# ---------------------------------------------------------------------------
+
+_TASK_KINDS = ("temporal_full", *_SEQ_TASK_KINDS)
+
+
+def _build_dispatch() -> None:
+    """
+    Erzeugt für jedes Task-Kind eine spezialisierte Methode
+    Orchestrator._dispatch_<kind>(self, payload): feste Methodenreferenz,
+    Defaults als Konstanten, kein **payload-Entpacken.
+    """
+    d = {k: repr(v) for k, v in _TASK_DEFAULTS.items()}
+
+    sources = [
+        "def _dispatch_temporal_full(self, pl):\n"
+        "    return self.temporal_full(\n"
+        "        pl['patterns'], pl['structures'], pl['points'], pl['motion'],\n"
+        f"        with_debug=pl.get('with_debug', {d['with_debug']}),\n"
+        f"        with_diagnostics=pl.get('with_diagnostics', {d['with_diagnostics']}),\n"
+        "    )\n"
+    ]
+    for kind in _SEQ_TASK_KINDS:
+        sources.append(
+            f"def _dispatch_{kind}(self, pl):\n"
+            f"    return self.{kind}(\n"
+            f"        pl.get('seq', {d['seq']}),\n"
+            f"        pre_validated=pl.get('pre_validated', {d['pre_validated']}),\n"
+            "    )\n"
+        )
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(sources), "<orchestrator-dispatch>", "exec"), namespace)
+    for kind in _TASK_KINDS:
+        name = "_dispatch_" + kind
+        setattr(Orchestrator, name, namespace[name])
+
+
+_build_dispatch()
+
+
+# ---------------------------------------------------------------------------
+# Prozess-Pool-Worker
+# ---------------------------------------------------------------------------
+
+# pro Worker-Prozess einmal aufgebaut, je Orchestrator-Version
+_WORKER_ORCHESTRATORS: Dict[str, Orchestrator] = {}
+
+
+def _dispatch(kind: str, payload: Dict[str, Any], version: str) -> Dict[str, Any]:
+    """
+    Modulweite (picklebare) Task-Ausführung für Prozess-Pool und Celery.
+    Lazy-Diagnostics werden vor der Rückgabe materialisiert (picklebar).
+    """
+    orch = _WORKER_ORCHESTRATORS.get(version)
+    if orch is None:
+        orch = Orchestrator(version=version)
+        _WORKER_ORCHESTRATORS[version] = orch
+    res = orch.run_task(kind, payload)
+    if isinstance(res.get("diagnostics"), _LazyDiagnostic):
+        res["diagnostics"] = dict(res["diagnostics"])
+    return res
+
+
+def _dispatch_tuple(job: tuple) -> Dict[str, Any]:
+    """pool.map-Variante von _dispatch: job = (kind, payload, version)."""
+    return _dispatch(*job)
+
+
+# ---------------------------------------------------------------------------
+# Celery-Backend (optional)
+# ---------------------------------------------------------------------------
+
+if HAVE_CELERY:
+    _CELERY_BROKER = os.getenv("SAHAM_CELERY_BROKER", "redis://localhost:6379/0")
+
+    celery_app = Celery(
+        "saham_orchestrator",
+        broker=_CELERY_BROKER,
+        backend=os.getenv("SAHAM_CELERY_BACKEND", _CELERY_BROKER),
+    )
+
+    @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+    def run_agent_task(self, kind: str, payload: Dict[str, Any], version: str) -> Dict[str, Any]:
+        """Celery-Worker-Einstieg: gleiche Ausführung wie im Prozess-Pool."""
+        try:
+            return _dispatch(kind, payload, version)
+        except Exception as e:
+            raise self.retry(exc=e)
+else:
+    celery_app = None
+    run_agent_task = None
 
 
 # ---------------------------------------------------------------------------
@@ -5,6 +5,13 @@ Routing & Input-Analyse für das Multi-Agenten-System.
 
 from typing import Any, Dict, List, Literal, Union
 
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
 
 InputType = Literal[
     "patterns",
@@ -17,6 +24,50 @@ InputType = Literal[
 ]
 
 
+# Normalisierung von Aliassen (einmalig auf Modulebene)
+_KEY_ALIASES: Dict[str, str] = {
+    "pattern": "patterns",
+    "pattern_units": "patterns",
+    "structure": "structures",
+    "structures": "structures",
+    "points": "points",
+    "point_units": "points",
+    "motion": "dynamics",
+    "dynamics": "dynamics",
+}
+
+# Jeder Einzel-Typ bekommt ein Bit; Key -> Bit (inkl. Aliasse)
+_TYPE_BITS: Dict[str, int] = {"patterns": 1, "structures": 2, "points": 4, "dynamics": 8}
+_BIT_TO_TYPE: Dict[int, str] = {bit: t for t, bit in _TYPE_BITS.items()}
+_KEY_MASK: Dict[str, int] = {
+    **_TYPE_BITS,
+    **{k: _TYPE_BITS[t] for k, t in _KEY_ALIASES.items()},
+}
+
+# Ab dieser Länge lohnt sich der Numerik-Check in C (np.asarray)
+_NUMPY_SCAN_MIN_LEN = 1024
+
+
+def _is_numeric_list(data: List[Any]) -> bool:
+    """True, wenn alle Einträge int/float (inkl. bool) sind."""
+    if HAVE_NUMPY and len(data) > _NUMPY_SCAN_MIN_LEN:
+        try:
+            arr = np.asarray(data)
+        except ValueError:
+            # inhomogen (z.B. verschachtelte Listen)
+            return False
+        if arr.ndim != 1:
+            # gleichförmig verschachtelt ([[1, 2]] * n) -> keine flache Zahlenliste
+            return False
+        kind = arr.dtype.kind
+        if kind in "biuf":
+            return True
+        if kind != "O":
+            return False
+        # dtype=object (z.B. sehr große ints, None): Python-Scan entscheidet
+    return all(isinstance(x, (int, float)) for x in data)
+
+
 def detect_input_type(data: Any) -> InputType:
     """
     Versucht zu erkennen, was für eine Eingabe wir haben.
@@ -34,44 +85,29 @@ def detect_input_type(data: Any) -> InputType:
     # Liste -> Sequenz
     if isinstance(data, list):
         # reine numerische Liste = Pattern-Sequence
-        if all(isinstance(x, (int, float)) for x in data):
+        if _is_numeric_list(data):
             return "sequence"
         return "unknown"
 
     if not isinstance(data, dict):
         return "unknown"
 
-    keys = set(data.keys())
-
-    # Normalisierung von Aliassen
-    key_aliases = {
-        "pattern": "patterns",
-        "pattern_units": "patterns",
-        "structure": "structures",
-        "structures": "structures",
-        "points": "points",
-        "point_units": "points",
-        "motion": "dynamics",
-        "dynamics": "dynamics",
-    }
-
-    norm_keys = set()
-    for k in keys:
-        norm_keys.add(key_aliases.get(k, k))
-
-    # Einzel-Typen
-    if "patterns" in norm_keys and len(norm_keys) == 1:
-        return "patterns"
-    if "structures" in norm_keys and len(norm_keys) == 1:
-        return "structures"
-    if "points" in norm_keys and len(norm_keys) == 1:
-        return "points"
-    if "dynamics" in norm_keys and len(norm_keys) == 1:
-        return "dynamics"
+    # Keys -> Bitmaske der erkannten Typen (+ Merker für fremde Keys)
+    mask = 0
+    foreign = False
+    for k in data:
+        bit = _KEY_MASK.get(k, 0)
+        if bit:
+            mask |= bit
+        else:
+            foreign = True
+
+    # Einzel-Typ: genau ein Bit gesetzt, keine fremden Keys
+    if not foreign and mask in _BIT_TO_TYPE:
+        return _BIT_TO_TYPE[mask]
 
     # Multi-Agenten-Input
-    multi_keys = {"patterns", "structures", "points", "dynamics"}
-    if len(norm_keys.intersection(multi_keys)) >= 2:
+    if mask.bit_count() >= 2:
         return "multi"
 
     return "unknown"
@@ -130,3 +166,20 @@ def build_system_prompt() -> str:
         "Wenn du mehrere Tools aufrufst, nutze sie in sinnvoller Reihenfolge und "
         "erkläre dem Nutzer, was du getan hast."
     )
+
+
+# ----------------------------------------------------------------------
+# Optional: Direktstart-Selbsttest (manueller Aufruf)
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    n = _NUMPY_SCAN_MIN_LEN + 976
+
+    assert detect_input_type([1, 2, 3]) == "sequence"
+    assert detect_input_type([0.5] * n) == "sequence"
+    # Regression: verschachtelte numerische Listen über der NumPy-Schwelle
+    # sind keine Sequenz (wie beim elementweisen Check)
+    assert detect_input_type([[1, 2]] * n) == "unknown"
+    assert detect_input_type([[1, 2]] * 3) == "unknown"
+    assert detect_input_type([1, None] * n) == "unknown"
+
+    print("orchestrator_logic1: Selbsttest OK")
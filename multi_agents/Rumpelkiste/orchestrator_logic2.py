@@ -27,7 +27,6 @@ Design:
 
 from __future__ import annotations
 
-import traceback
 from typing import Any, Dict, Callable
 
 # Agenten imports (HQ-Standard: try both)
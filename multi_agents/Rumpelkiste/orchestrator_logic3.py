@@ -4,7 +4,35 @@
 
 from __future__ import annotations
 from typing import Any, Dict, List, Callable
-import traceback
+from collections.abc import Mapping
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+
+# Celery (optional, verteilte Task-Queue)
+try:
+    from celery import Celery
+    HAVE_CELERY = True
+except ImportError:
+    Celery = None
+    HAVE_CELERY = False
+
+# orjson (optional, schnellere Serialisierung an der Agent-Grenze)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None
+    HAVE_ORJSON = False
 
 # ---------------------------------------------------------
 # Agent Imports (pattern → fusion)
@@ -29,18 +57,53 @@ except ImportError:
     from fusion_agent import FusionAgent
 
 
+# ---------------------------------------------------------
+# Task-Namen (interniert; Aufrufer können sie statt Literalen übergeben,
+# z.B. orch.run_task(TASK_CLUSTER_FULL, payload))
+# ---------------------------------------------------------
+TASK_PATTERNCORE_SUMMARY = sys.intern("patterncore_summary")
+TASK_COHERENCE_FULL = sys.intern("coherence_full")
+TASK_ANOMALY_FULL = sys.intern("anomaly_full")
+TASK_ANOMALY_PROFILE = sys.intern("anomaly_profile")
+TASK_FUSION_FULL = sys.intern("fusion_full")
+TASK_FUSION_PROFILE = sys.intern("fusion_profile")
+TASK_DRIFT_FULL = sys.intern("drift_full")
+TASK_DRIFT_PROFILE = sys.intern("drift_profile")
+TASK_GUARDIAN_FULL = sys.intern("guardian_full")
+TASK_GUARDIAN_PROFILE = sys.intern("guardian_profile")
+TASK_CLUSTER_FULL = sys.intern("cluster_full")
+TASK_CLUSTER_PROFILE = sys.intern("cluster_profile")
+TASK_CLUSTER_COMBINED = sys.intern("cluster_combined")
+TASK_HORIZON_FULL = sys.intern("horizon_full")
+TASK_HORIZON_PROFILE = sys.intern("horizon_profile")
+TASK_HORIZON_FORECAST = sys.intern("horizon_forecast")
+TASK_HORIZON_COMBINED = sys.intern("horizon_combined")
+TASK_TREND_FULL = sys.intern("trend_full")
+TASK_TREND_PROFILE = sys.intern("trend_profile")
+TASK_TREND_FORECAST = sys.intern("trend_forecast")
+TASK_TREND_COMBINED = sys.intern("trend_combined")
+TASK_TREND_STREAM = sys.intern("trend_stream")
+TASK_FORECAST_FULL = sys.intern("forecast_full")
+TASK_FORECAST_PROFILE = sys.intern("forecast_profile")
+TASK_FORECAST_SCENARIOS = sys.intern("forecast_scenarios")
+TASK_FORECAST_COMBINED = sys.intern("forecast_combined")
+
+
 # ---------------------------------------------------------
 # GuardianGate – Mini-Sanity Layer
 # ---------------------------------------------------------
-def guardian_gate_input(task: str, payload: Any):
-    warnings = []
+def guardian_gate_input(task: str, payload: Any, warnings: List[dict] = None):
+    # ergänzt warnings in-place (neue Liste nur, wenn keine übergeben)
+    if warnings is None:
+        warnings = []
     if payload is None:
         warnings.append({"source": "guardian_gate", "reason": f"Payload is None for task {task}"})
     return warnings
 
 
-def guardian_gate_output(task: str, output: Any):
-    warnings = []
+def guardian_gate_output(task: str, output: Any, warnings: List[dict] = None):
+    if warnings is None:
+        warnings = []
     if not isinstance(output, dict):
         warnings.append({"source": "guardian_gate", "reason": f"Output of {task} is not a dict"})
     return warnings
@@ -49,161 +112,585 @@ def guardian_gate_output(task: str, output: Any):
 # ---------------------------------------------------------
 # DiagnosticCore – Mini-Diagnose
 # ---------------------------------------------------------
+# str(type(x)) je Typ nur einmal formatieren
+_TYPE_NAMES: Dict[type, str] = {}
+
+
+def _type_name(obj: Any) -> str:
+    t = type(obj)
+    name = _TYPE_NAMES.get(t)
+    if name is None:
+        name = _TYPE_NAMES[t] = str(t)
+    return name
+
+
 def diagnostic_simple(result: Any, debug: Any):
     return {
         "has_debug": isinstance(debug, dict),
         "debug_keys": list(debug.keys()) if isinstance(debug, dict) else [],
-        "result_type": str(type(result)),
+        "result_type": _type_name(result),
     }
 
 
+class _LazyDiagnostics(Mapping):
+    """
+    diagnostic_simple über den Agent-Output (dict), erst beim ersten
+    Zugriff berechnet – auch result/debug werden erst dann gelesen.
+    Für JSON: as_dict() bzw. dict(res["diagnostics"]).
+    """
+
+    __slots__ = ("out", "_cached")
+
+    def __init__(self, out: Dict[str, Any]) -> None:
+        self.out = out
+        self._cached = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        if self._cached is None:
+            out = self.out
+            self._cached = diagnostic_simple(out.get("result"), out.get("debug"))
+        return self._cached
+
+    def __getitem__(self, key: str) -> Any:
+        return self.as_dict()[key]
+
+    def __iter__(self):
+        return iter(self.as_dict())
+
+    def __len__(self) -> int:
+        return len(self.as_dict())
+
+    def __repr__(self) -> str:
+        return repr(self.as_dict())
+
+
+# Positionale Ergebnis-Konstruktoren (Hot Path ohne kwargs)
+def _ok(result: Any, warnings: List[dict], diagnostics: Any, agent: str, task: str) -> OrchResult:
+    return OrchResult(True, result, warnings, diagnostics, agent, task)
+
+
+def _err(warnings: List[dict], agent: str, task: str) -> OrchResult:
+    return OrchResult(False, None, warnings, None, agent, task)
+
+
+# geteilter leerer Default für Serien-Keys (kein neues [] pro Aufruf)
+_EMPTY: tuple = ()
+
+
+def _agent_payload(payload: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Agent-Payload aus dem Task-Payload. Trägt payload bereits genau die
+    Agent-Keys, wird es ohne Kopie durchgereicht.
+    """
+    if payload.keys() == defaults.keys():
+        return payload
+    return {key: payload.get(key, default) for key, default in defaults.items()}
+
+
+# ---------------------------------------------------------
+# Serialisierung (Celery/Redis-Grenze)
+# ---------------------------------------------------------
+def _json_default(obj: Any) -> Any:
+    """Fallback für Nicht-JSON-Typen: Mappings, numpy (tolist), sonst str."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return str(obj)
+
+
+def dumps_result(obj: Any) -> bytes:
+    """JSON-Bytes; orjson (numpy nativ), sonst json mit _json_default."""
+    if HAVE_ORJSON:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=_json_default,
+        )
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def loads_result(raw: Any) -> Any:
+    if HAVE_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# ---------------------------------------------------------
+# Einheitliches Ergebnis (HQ-Standard)
+# ---------------------------------------------------------
+@dataclass(slots=True)
+class OrchResult:
+    """
+    Rückgabe aller Tasks (ok / result / warnings / diagnostics / agent / task).
+    Dict-Form erst an der Serialisierungsgrenze: to_dict().
+    res["result"] funktioniert weiterhin (Lesezugriff).
+    """
+
+    ok: bool
+    result: Any
+    warnings: List[dict]
+    diagnostics: Any
+    agent: str
+    task: str
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self) -> Dict[str, Any]:
+        diagnostics = self.diagnostics
+        if isinstance(diagnostics, _LazyDiagnostics):
+            diagnostics = diagnostics.as_dict()
+        return {
+            "ok": self.ok,
+            "result": self.result,
+            "warnings": self.warnings,
+            "diagnostics": diagnostics,
+            "agent": self.agent,
+            "task": self.task,
+        }
+
+    def to_json(self) -> bytes:
+        return dumps_result(self.to_dict())
+
+
+# ---------------------------------------------------------
+# Registrierungs-Hooks der Agent-Patches (siehe unten)
+# ---------------------------------------------------------
+_AGENT_PATCHES: List[Callable[[Any], None]] = []
+
+# Kern-Agenten: (name, Klasse) in Registrierungsreihenfolge;
+# Erweiterungen (Drift, Guardian, ...) registrieren sich in ihren Mixins
+_AGENT_CLASSES = (
+    ("patterncore", PatternCore),
+    ("structureweaver", StructureWeaver),
+    ("pointengine", PointEngine),
+    ("pointdynamics", PointDynamics),
+    ("temporalsynth", TemporalSynth),
+    ("coherence", CoherenceAgent),
+    ("anomaly", AnomalyAgent),
+    ("fusion", FusionAgent),  # 🟦 Agent 8 – FusionAgent
+)
+
+# Größe des LRU-Caches für deterministische Agent-Tasks
+RESPONSE_CACHE_SIZE = 1024
+
+# max. Anzahl gleichzeitig gehaltener Streams (trend_stream)
+STREAM_STATE_SIZE = 1024
+
+
+def _fingerprint_default(obj: Any) -> Any:
+    # NumPy-Arrays/-Skalare über ihre Rohbytes hashen statt Element für Element
+    if hasattr(obj, "dtype") and hasattr(obj, "tobytes"):
+        if obj.dtype.kind == "O":
+            # Rohbytes wären PyObject-Zeiger: gleiche Adressen bei anderem
+            # Inhalt -> falscher Cache-Treffer. Solche Payloads nicht cachen.
+            raise TypeError("object arrays are not fingerprinted")
+        digest = hashlib.blake2b(obj.tobytes(), digest_size=16).hexdigest()
+        return ["__ndarray__", str(obj.dtype), list(obj.shape), digest]
+    raise TypeError(f"not JSON serializable: {_type_name(obj)}")
+
+
+def _payload_fingerprint(payload: Any):
+    """
+    16-Byte-Hash des Payloads (kanonisches JSON, Arrays per Inhalts-Hash);
+    None, wenn nicht serialisierbar (-> kein Caching). Bewusst stdlib-json:
+    orjson bildet NaN/Inf auf null ab und ließe sie mit None kollidieren.
+    """
+    try:
+        raw = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=_fingerprint_default
+        ).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+# Circuit Breaker: nach BREAKER_THRESHOLD Exceptions in Folge wird ein
+# Agent für BREAKER_COOLDOWN Sekunden nicht mehr aufgerufen
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+
+# Upstream-Agenten für guardian_* (Payload-Schlüssel, Agent, Task);
+# laufen in run_task_async nebenläufig, wenn payload["upstream"] sie liefert
+_GUARDIAN_UPSTREAM = (
+    ("drift", "drift", "drift_full"),
+    ("coherence", "coherence", "coherence_full"),
+    ("anomaly", "anomaly", "anomaly_full"),
+)
+
+
 # =====================================================================
 # ORCHESTRATOR 0.7 – MIT FUSIONAGENT
 # =====================================================================
 class Orchestrator:
 
+    # True: GuardianGate-Funktionen aufrufen (Debug/Verbose);
+    # False: gleiche Prüfungen inline im Dispatcher (Fast Path)
+    _strict_guard = False
+
     def __init__(self):
         self.agents: Dict[str, Any] = {}
+        self._agent_factories: Dict[str, Callable[[], Any]] = {}
+        self.agent_errors: Dict[str, Any] = {}
+
+        # gebundene .run-Methode je Agent, einmal bei Instanziierung aufgelöst
+        self._agent_run: Dict[str, Callable[..., Any]] = {}
+
+        # LRU-Cache (agent, task, Payload-Fingerprint) -> Agent-Output;
+        # nur für Agent-Tasks in _cacheable_tasks (reine Funktionen des Payloads)
+        self._cacheable_tasks: set = set()
+        self._response_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+        # Circuit Breaker je Agent: {"fail": n, "open_until": monotonic-Zeit}
+        self._breaker: Dict[str, Dict[str, float]] = {}
+
+        # Streaming-Zustand je (agent, stream_id), LRU-begrenzt auf STREAM_STATE_SIZE
+        self._stream_state: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._stream_lock = threading.Lock()
+
+        # Thread-Pool für run_tasks_parallel (lazy, ein Pool je Orchestrator)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
         self._register_default_agents()
 
     # ------------------------------------------------------
     # Agent-Registry
     # ------------------------------------------------------
     def _register_default_agents(self):
-        errors = {}
-
-        try: self.agents["patterncore"] = PatternCore()
-        except Exception as e: errors["patterncore"] = e
+        # Nur Klassen registrieren; Instanzen entstehen lazy in _get_agent
+        self._agent_factories.update(_AGENT_CLASSES)
+
+        # Task-Dispatch-Tabelle: Taskname -> Handler(payload, warnings).
+        # Patches erweitern diese Tabelle, statt run_task zu verketten.
+        self._dispatch: Dict[str, Callable[[Dict[str, Any], List[dict]], Dict[str, Any]]] = {
+            TASK_PATTERNCORE_SUMMARY: self._data_task(self.patterncore_summary),
+            TASK_COHERENCE_FULL: self._data_task(self.coherence_full),
+            TASK_ANOMALY_FULL: self._data_task(self.anomaly_full),
+            TASK_ANOMALY_PROFILE: self._data_task(self.anomaly_profile),
+            TASK_FUSION_FULL: self._data_task(self.fusion_full),
+            TASK_FUSION_PROFILE: self._data_task(self.fusion_profile),
+        }
+        self._valid_tasks = frozenset(self._dispatch)
+        self._cacheable_tasks.update((
+            "pattern_summary", "coherence_full", "anomaly_full", "anomaly_profile",
+            "fusion_full", "fusion_profile",
+        ))
 
-        try: self.agents["structureweaver"] = StructureWeaver()
-        except Exception as e: errors["structureweaver"] = e
+    def register_agent(self, name: str, factory: Callable[[], Any]) -> None:
+        self._agent_factories[name] = factory
 
-        try: self.agents["pointengine"] = PointEngine()
-        except Exception as e: errors["pointengine"] = e
+    def _get_agent(self, name: str):
+        """Agent-Instanz (beim ersten Zugriff erzeugt) oder None."""
+        agent = self.agents.get(name)
+        if agent is not None:
+            return agent
 
-        try: self.agents["pointdynamics"] = PointDynamics()
-        except Exception as e: errors["pointdynamics"] = e
+        factory = self._agent_factories.get(name)
+        if factory is None or name in self.agent_errors:
+            return None
 
-        try: self.agents["temporalsynth"] = TemporalSynth()
-        except Exception as e: errors["temporalsynth"] = e
+        try:
+            agent = factory()
+        except Exception as e:
+            self.agent_errors[name] = e
+            print("[WARN] Agent load error:", name, e)
+            return None
 
-        try: self.agents["coherence"] = CoherenceAgent()
-        except Exception as e: errors["coherence"] = e
+        self.agents[name] = agent
+        self._agent_run[name] = getattr(agent, "run", None)
+        return agent
 
-        try: self.agents["anomaly"] = AnomalyAgent()
-        except Exception as e: errors["anomaly"] = e
+    def register_task(
+        self,
+        name: str,
+        handler: Callable[[Dict[str, Any], List[dict]], Dict[str, Any]],
+        *,
+        cacheable: bool = False,
+    ) -> None:
+        # cacheable=True: Agent-Task gleichen Namens ist eine reine Funktion des Payloads
+        name = sys.intern(name)
+        self._dispatch[name] = handler
+        self._valid_tasks = frozenset(self._dispatch)
+        if cacheable:
+            self._cacheable_tasks.add(name)
+
+    def _register_agent_tasks(self, agent_name: str, tasks, args: Dict[str, Any]) -> None:
+        """
+        Reine Agent-Tasks registrieren: Task-Payload (Schema args) -> Agent-Task
+        gleichen Namens, cachebar.
+        """
+        for task in tasks:
+            self.register_task(task, self._agent_task_handler(agent_name, task, args), cacheable=True)
+
+    def _agent_task_handler(self, agent_name: str, task: str, args: Dict[str, Any]):
+        return lambda payload, warnings: self._dispatch_simple(
+            agent_name, task, _agent_payload(payload, args), warnings
+        )
 
-        # 🟦 Agent 8 – FusionAgent
-        try: self.agents["fusion"] = FusionAgent()
-        except Exception as e: errors["fusion"] = e
+    def _dispatch_simple(self, agent_name: str, task: str, args: Dict[str, Any], warnings=None):
+        """Ein Agent-Aufruf -> fertiges OrchResult (Dispatch-Tabelle und *_full-Methoden)."""
+        if warnings is None:
+            warnings = []
+        out, warnings, diagnostics = self._safe_call_agent(agent_name, task, args, warnings)
+        if out is None:
+            return _err(warnings, agent_name, task)
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
 
-        if errors:
-            print("[WARN] Agent load errors:", errors)
+    @staticmethod
+    def _data_task(method):
+        """Adapter für Tasks mit Payload-Schema {"data": ...}."""
+        return lambda payload, warnings: method(payload.get("data"), warnings=warnings)
 
     # ------------------------------------------------------
     def list_agents(self):
-        return list(self.agents.keys())
-
-    # ------------------------------------------------------
-   class Orchestrator:
-    ...
-    ...
-    # ------------------------------------------------------------
-    # Einheitlicher Rückgabe-Wrapper (HQ-Standard)
-    # ------------------------------------------------------------
-    def _wrap(
-        self,
-        ok: bool,
-        result,
-        warnings,
-        diagnostics,
-        agent: str,
-        task: str,
-    ):
-        return {
-            "ok": bool(ok),
-            "result": result,
-            "warnings": warnings or [],
-            "diagnostics": diagnostics,
-            "agent": agent,
-            "task": task,
-        }
-
-
+        return [name for name in self._agent_factories if name not in self.agent_errors]
 
     # ------------------------------------------------------
     # Zentrale Agent-Ausführung
     # ------------------------------------------------------
     def _safe_call_agent(self, agent_name: str, task: str, payload: Dict[str, Any], warnings):
-        if agent_name not in self.agents:
-            warnings.append({"source": "orchestrator", "reason": f"Agent '{agent_name}' not loaded"})
+        key = None
+        if task in self._cacheable_tasks:
+            fp = _payload_fingerprint(payload)
+            if fp is not None:
+                key = (agent_name, task, fp)
+                with self._response_cache_lock:
+                    hit = self._response_cache.get(key)
+                    if hit is not None:
+                        self._response_cache.move_to_end(key)
+                if hit is not None:
+                    out = copy.deepcopy(hit)
+                    return out, warnings, _LazyDiagnostics(out)
+
+        breaker = self._breaker.get(agent_name)
+        if breaker is None:
+            breaker = self._breaker[agent_name] = {"fail": 0, "open_until": 0.0}
+        elif time.monotonic() < breaker["open_until"]:
+            warnings.append({"source": "breaker", "reason": f"Agent '{agent_name}' circuit open"})
             return None, warnings, None
 
-        agent = self.agents[agent_name]
+        agent = self._get_agent(agent_name)
+        if agent is None:
+            warnings.append({"source": "orchestrator", "reason": f"Agent '{agent_name}' not loaded"})
+            return None, warnings, None
 
         # Agent-Aufruf
         try:
-            out = agent.run(task, payload, with_debug=True)
+            out = self._agent_run[agent_name](task, payload, with_debug=True)
         except Exception as e:
+            breaker["fail"] += 1
+            if breaker["fail"] >= BREAKER_THRESHOLD:
+                breaker["open_until"] = time.monotonic() + BREAKER_COOLDOWN
             warnings.append({"source": "agent_exception", "reason": str(e)})
             return None, warnings, None
+        breaker["fail"] = 0
+
+        if key is not None and isinstance(out, dict):
+            cached = copy.deepcopy(out)
+            with self._response_cache_lock:
+                self._response_cache[key] = cached
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+
+        # Guardian output check – ab hier ist out garantiert ein dict
+        if self._strict_guard:
+            guardian_gate_output(task, out, warnings)
+        elif not isinstance(out, dict):
+            warnings.append({"source": "guardian_gate", "reason": f"Output of {task} is not a dict"})
+        if not isinstance(out, dict):
+            return None, warnings, None
 
-        # Guardian output check
-        warnings += guardian_gate_output(task, out)
-
-        diagnostics = diagnostic_simple(out.get("result"), out.get("debug"))
-
-        return out, warnings, diagnostics
+        return out, warnings, _LazyDiagnostics(out)
 
     # ------------------------------------------------------
     # Central Dispatcher
     # ------------------------------------------------------
     def run_task(self, task_name: str, payload: Dict[str, Any]):
-        warnings = guardian_gate_input(task_name, payload)
+        # Fast negative path: unbekannte Tasks vor jeder Guard-Arbeit abweisen
+        if task_name not in self._valid_tasks:
+            return _err(
+                [{"source": "dispatcher", "reason": f"Unknown task {task_name}"}],
+                "n/a",
+                task_name,
+            )
+
+        if self._strict_guard:
+            warnings = guardian_gate_input(task_name, payload)
+        elif payload is not None:
+            warnings = []
+        else:
+            warnings = [{"source": "guardian_gate", "reason": f"Payload is None for task {task_name}"}]
 
         try:
-            # PatternCore
-            if task_name == "patterncore_summary":
-                return self.patterncore_summary(payload.get("data"), warnings=warnings)
+            return self._dispatch[task_name](payload, warnings)
+        except Exception as e:
+            warnings.append({"source": "dispatcher", "reason": str(e)})
+            return _err(warnings, "n/a", task_name)
 
-            # Coherence
-            if task_name == "coherence_full":
-                return self.coherence_full(payload.get("data"), warnings=warnings)
+    # ------------------------------------------------------
+    # Celery-Backend (run_task ohne Blockieren des Aufrufers)
+    # ------------------------------------------------------
+    def submit_task(self, task_name: str, payload: Dict[str, Any]) -> str:
+        """
+        Reicht run_task(task_name, payload) an die Celery-Worker weiter
+        und liefert sofort die Task-ID (Status: task_status()).
+        """
+        if not HAVE_CELERY:
+            raise RuntimeError("Celery ist nicht installiert (submit_task).")
+        task_id = str(uuid.uuid4())
+        run_orchestrator_task.apply_async(args=(task_name, payload), task_id=task_id)
+        return task_id
+
+    @staticmethod
+    def task_status(task_id: str) -> Dict[str, Any]:
+        """
+        Status einer per submit_task eingereichten Aufgabe.
+        result ist erst bei state == "SUCCESS" gesetzt.
+        """
+        if not HAVE_CELERY:
+            raise RuntimeError("Celery ist nicht installiert (submit_task).")
+        res = celery_app.AsyncResult(task_id)
+        return {
+            "task_id": task_id,
+            "state": res.state,
+            "result": res.result if res.successful() else None,
+        }
 
-            # Anomaly
-            if task_name == "anomaly_full":
-                return self.anomaly_full(payload.get("data"), warnings=warnings)
+    # ------------------------------------------------------
+    # Async-Dispatcher (Fan-out über asyncio.gather)
+    # ------------------------------------------------------
+    async def _safe_call_agent_async(self, agent_name: str, task: str, payload: Dict[str, Any], warnings):
+        # Agenten sind synchron/CPU-lastig -> Thread-Pool des Event-Loops
+        return await asyncio.to_thread(self._safe_call_agent, agent_name, task, payload, warnings)
+
+    async def run_task_async(self, task_name: str, payload: Dict[str, Any]):
+        """
+        Async-Variante von run_task.
+
+        guardian_full / guardian_profile: fehlende Eingaben (drift, coherence,
+        anomaly), deren Rohdaten in payload["upstream"] stehen, werden vorher
+        nebenläufig von den jeweiligen Agenten berechnet.
+        """
+        if task_name in ("guardian_full", "guardian_profile") and isinstance(payload, dict):
+            upstream = payload.get("upstream") or {}
+            jobs = [
+                (key, agent_name, task)
+                for key, agent_name, task in _GUARDIAN_UPSTREAM
+                if key in upstream and payload.get(key) is None
+            ]
+            if jobs:
+                results = await asyncio.gather(*(
+                    self._safe_call_agent_async(agent_name, task, upstream[key], [])
+                    for key, agent_name, task in jobs
+                ))
+                payload = dict(payload)
+                upstream_warnings = []
+                for (key, _, _), (out, warnings, _) in zip(jobs, results):
+                    upstream_warnings.extend(warnings)
+                    payload[key] = out.get("result") if isinstance(out, dict) else None
+
+                res = await asyncio.to_thread(self.run_task, task_name, payload)
+                upstream_warnings.extend(res.warnings)
+                res.warnings = upstream_warnings
+                return res
+
+        return await asyncio.to_thread(self.run_task, task_name, payload)
 
-            if task_name == "anomaly_profile":
-                return self.anomaly_profile(payload.get("data"), warnings=warnings)
+    # ------------------------------------------------------
+    # Parallel-Dispatcher (mehrere Tasks über einen Thread-Pool)
+    # ------------------------------------------------------
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=os.cpu_count() or 1,
+                        thread_name_prefix="saham-orch",
+                    )
+        return self._executor
+
+    def run_tasks_parallel(self, tasks: List[Dict[str, Any]]) -> List[OrchResult]:
+        """
+        Unabhängige Tasks nebenläufig über run_task ausführen.
+        tasks: [{"name": ..., "payload": ...}, ...] – Ergebnisse in Eingabereihenfolge.
+        """
+        if len(tasks) < 2:
+            return [self.run_task(t.get("name"), t.get("payload")) for t in tasks]
+        return list(self._get_executor().map(
+            lambda t: self.run_task(t.get("name"), t.get("payload")), tasks
+        ))
 
-            # 🟦 FusionAgent
-            if task_name == "fusion_full":
-                return self.fusion_full(payload.get("data"), warnings=warnings)
+    # =====================================================================
+    # PATTERNCORE / COHERENCE / ANOMALY
+    # =====================================================================
+    def patterncore_summary(self, data, warnings=None):
+        warnings = [] if warnings is None else warnings
+        agent_name = "patterncore"
+        task = "pattern_summary"
 
-            if task_name == "fusion_profile":
-                return self.fusion_profile(payload.get("data"), warnings=warnings)
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name, task, {"data": data}, warnings
+        )
 
-        except Exception as e:
-            return self._wrap(
-                ok=False,
-                result=None,
-                warnings=warnings + [{"source": "dispatcher", "reason": str(e)}],
-                task=task_name,
-            )
+        if out is None:
+            return _err(warnings, agent_name, task)
+
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
+
+    def coherence_full(self, data, warnings=None):
+        warnings = [] if warnings is None else warnings
+        agent_name = "coherence"
+        task = "coherence_full"
+
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name, task, {"data": data}, warnings
+        )
+
+        if out is None:
+            return _err(warnings, agent_name, task)
+
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
+
+    def anomaly_full(self, data, warnings=None):
+        warnings = [] if warnings is None else warnings
+        agent_name = "anomaly"
+        task = "anomaly_full"
+
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name, task, {"data": data}, warnings
+        )
+
+        if out is None:
+            return _err(warnings, agent_name, task)
+
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
+
+    def anomaly_profile(self, data, warnings=None):
+        warnings = [] if warnings is None else warnings
+        agent_name = "anomaly"
+        task = "anomaly_profile"
 
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings + [{"source": "dispatcher", "reason": f"Unknown task {task_name}"}],
-            task=task_name,
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name, task, {"data": data}, warnings
         )
 
+        if out is None:
+            return _err(warnings, agent_name, task)
+
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
+
     # =====================================================================
     # FUSIONAGENT – Vollständige Integration
     # =====================================================================
     def fusion_full(self, data, warnings=None):
-        warnings = warnings or []
+        warnings = [] if warnings is None else warnings
         agent_name = "fusion"
         task = "fusion_full"
 
@@ -212,19 +699,12 @@ class Orchestrator:
         )
 
         if out is None:
-            return self._wrap(ok=False, result=None, warnings=warnings, agent=agent_name, task=task)
+            return _err(warnings, agent_name, task)
 
-        return self._wrap(
-            ok=True,
-            result=out["result"],
-            warnings=warnings,
-            diagnostics=diagnostics,
-            agent=agent_name,
-            task=task,
-        )
+        return _ok(out["result"], warnings, diagnostics, agent_name, task)
 
     def fusion_profile(self, data, warnings=None):
-        warnings = warnings or []
+        warnings = [] if warnings is None else warnings
         agent_name = "fusion"
         task = "fusion_profile"
 
@@ -233,16 +713,9 @@ class Orchestrator:
         )
 
         if out is None:
-            return self._wrap(ok=False, result=None, warnings=warnings, agent=agent_name, task=task)
+            return _err(warnings, agent_name, task)
 
-        return self._wrap(
-            ok=True,
-            result=out["result"],
-            warnings=warnings,
-            diagnostics=diagnostics,
-            agent=agent_name,
-            task=task,
-        )
+        return _ok(out["result"], warnings, diagnostics, agent_name, task)
 # ======================================================================
 # DRIFTAGENT-INTEGRATION – EIN GUSS PATCH
 # ======================================================================
@@ -252,14 +725,14 @@ DriftAgent-Orchestrator-Erweiterung (Snapshot-Level)
 Voraussetzung:
     - multi_agents.drift_agent.DriftAgent ist vorhanden
     - Orchestrator-Klasse ist oben definiert
-    - _register_default_agents, run_task und _safe_call_agent existieren
+    - register_agent, register_task und _safe_call_agent existieren
 
 Wirkung:
     - registriert Agent "drift" automatisch
     - ergänzt Tasks:
         - "drift_full"
         - "drift_profile"
-    - fügt Methoden Orchestrator.drift_full / drift_profile hinzu
+    - fügt Methoden DriftMixin.drift_full / drift_profile hinzu
     - alles ohne bestehende Definitionen im Kopf bearbeiten zu müssen
 """
 
@@ -269,140 +742,67 @@ except ImportError:
     from drift_agent import DriftAgent
 
 
-# Original-Methoden sichern
-_original_register_default_agents = Orchestrator._register_default_agents
-_original_run_task = Orchestrator.run_task
-
-
-def _register_default_agents_with_drift(self):
-    """
-    Wrap um die bestehende Agent-Registrierung:
-    Ruft zuerst das Original auf, ergänzt dann Agent 9 'drift'.
-    """
-    _original_register_default_agents(self)
-    try:
-        self.agents["drift"] = DriftAgent()
-    except Exception as e:
-        # Nur warnen, Orchestrator soll trotzdem startbar bleiben
-        print("[WARN] DriftAgent registration failed:", e)
-
-
-def _run_task_with_drift(self, task_name: str, payload: dict):
-    """
-    Erweiterter Dispatcher:
-    - behandelt zuerst die Drift-Tasks
-    - für alles andere: ursprünglichen Dispatcher verwenden
-    """
-    warnings = []
-    try:
-        # Drift-spezifische Tasks zuerst abfangen
-        if task_name == "drift_full":
-            return self.drift_full(
-                payload.get("previous"),
-                payload.get("current"),
-                warnings=warnings,
-            )
+class DriftMixin:
+    """DriftAgent-Erweiterung für den Orchestrator (siehe SahamOrchestrator)."""
 
-        if task_name == "drift_profile":
-            return self.drift_profile(
-                payload.get("previous"),
-                payload.get("current"),
-                warnings=warnings,
-            )
-
-    except Exception as e:
-        # Falls hier etwas schief geht, trotzdem nicht den alten Dispatcher blockieren
-        warnings.append({"source": "drift_dispatch", "reason": str(e)})
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent="drift",
-            task=task_name,
-        )
-
-    # Alle anderen Tasks wie bisher
-    return _original_run_task(self, task_name, payload)
-
-
-# Neue Drift-Methoden definieren und an Orchestrator hängen
-def _drift_full(self, previous_snapshot, current_snapshot, warnings=None):
-    """
-    Vollständige Driftanalyse zwischen zwei Snapshots.
-    """
-    warnings = warnings or []
-    agent_name = "drift"
-    task = "drift_full"
-
-    # Nutzung der bestehenden Safe-Call-Logik
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"previous": previous_snapshot, "current": current_snapshot},
-        warnings,
-    )
-
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
+    def _register_default_agents(self):
+        """
+        Kooperative Registrierung (super()): ergänzt Agent 9 'drift' samt Tasks.
+        """
+        super()._register_default_agents()
+
+        self.register_agent("drift", DriftAgent)
+
+        # Tasks in die Dispatch-Tabelle eintragen
+        self.register_task(TASK_DRIFT_FULL, lambda payload, warnings: self.drift_full(
+            payload.get("previous"), payload.get("current"), warnings=warnings
+        ), cacheable=True)
+        self.register_task(TASK_DRIFT_PROFILE, lambda payload, warnings: self.drift_profile(
+            payload.get("previous"), payload.get("current"), warnings=warnings
+        ), cacheable=True)
+
+    # Drift-Methoden
+    def drift_full(self, previous_snapshot, current_snapshot, warnings=None):
+        """
+        Vollständige Driftanalyse zwischen zwei Snapshots.
+        """
+        warnings = [] if warnings is None else warnings
+        agent_name = "drift"
+        task = "drift_full"
+
+        # Nutzung der bestehenden Safe-Call-Logik
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name,
+            task,
+            {"previous": previous_snapshot, "current": current_snapshot},
+            warnings,
         )
 
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
+        if out is None:
+            return _err(warnings, agent_name, task)
 
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
 
-def _drift_profile(self, previous_snapshot, current_snapshot, warnings=None):
-    """
-    Liefert das vollständige Drift-Profil (Detailansicht).
-    """
-    warnings = warnings or []
-    agent_name = "drift"
-    task = "drift_profile"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"previous": previous_snapshot, "current": current_snapshot},
-        warnings,
-    )
+    def drift_profile(self, previous_snapshot, current_snapshot, warnings=None):
+        """
+        Liefert das vollständige Drift-Profil (Detailansicht).
+        """
+        warnings = [] if warnings is None else warnings
+        agent_name = "drift"
+        task = "drift_profile"
 
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name,
+            task,
+            {"previous": previous_snapshot, "current": current_snapshot},
+            warnings,
         )
 
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
+        if out is None:
+            return _err(warnings, agent_name, task)
 
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
 
-# Monkey-Patch aktivieren
-Orchestrator._register_default_agents = _register_default_agents_with_drift
-Orchestrator.run_task = _run_task_with_drift
-Orchestrator.drift_full = _drift_full
-Orchestrator.drift_profile = _drift_profile
 
 # ======================================================================
 # ENDE DRIFTAGENT-PATCH
@@ -429,183 +829,112 @@ except ImportError:
     from guardian_agent import GuardianAgent
 
 
-# ------------------------------------------------------------
-# Originalmethoden sichern
-# ------------------------------------------------------------
-_original_register_default_agents_G = Orchestrator._register_default_agents
-_original_run_task_G = Orchestrator.run_task
-
-
-# ------------------------------------------------------------
-# Erweiterte Agent-Registrierung
-# ------------------------------------------------------------
-def _register_default_agents_with_guardian(self):
-    """
-    Ruft zuerst die vorhandene Registrierung auf,
-    ergänzt danach Agent 10: 'guardian'.
-    """
-    _original_register_default_agents_G(self)
-
-    try:
-        self.agents["guardian"] = GuardianAgent()
-    except Exception as e:
-        print("[WARN] GuardianAgent registration failed:", e)
-
-
-# ------------------------------------------------------------
-# Dispatcher-Erweiterung
-# ------------------------------------------------------------
-def _run_task_with_guardian(self, task_name: str, payload: dict):
-    warnings = []
-
-    # Guardian-Tasks zuerst abfangen
-    try:
-        if task_name == "guardian_full":
-            return self.guardian_full(
-                payload.get("agent_states"),
-                payload.get("drift"),
-                payload.get("coherence"),
-                payload.get("anomaly"),
-                payload.get("temporal"),
-                payload.get("meta"),
-                warnings=warnings,
-            )
-
-        if task_name == "guardian_profile":
-            return self.guardian_profile(
-                payload.get("agent_states"),
-                payload.get("drift"),
-                payload.get("coherence"),
-                payload.get("anomaly"),
-                payload.get("temporal"),
-                payload.get("meta"),
-                warnings=warnings,
-            )
+class GuardianMixin:
+    """GuardianAgent-Erweiterung für den Orchestrator (siehe SahamOrchestrator)."""
 
-    except Exception as e:
-        warnings.append({"source": "guardian_dispatch", "reason": str(e)})
-        return self._wrap(
-            ok=False,
-            result=None,
+    # ------------------------------------------------------------
+    # Registrierung
+    # ------------------------------------------------------------
+    def _register_default_agents(self):
+        """
+        Kooperative Registrierung (super()): ergänzt Agent 10: 'guardian' samt Tasks.
+        """
+        super()._register_default_agents()
+
+        self.register_agent("guardian", GuardianAgent)
+
+        # Tasks in die Dispatch-Tabelle eintragen
+        self.register_task(TASK_GUARDIAN_FULL, lambda payload, warnings: self.guardian_full(
+            payload.get("agent_states"),
+            payload.get("drift"),
+            payload.get("coherence"),
+            payload.get("anomaly"),
+            payload.get("temporal"),
+            payload.get("meta"),
             warnings=warnings,
-            diagnostics=None,
-            agent="guardian",
-            task=task_name,
-        )
-
-    # Alle anderen Tasks wie bisher
-    return _original_run_task_G(self, task_name, payload)
-
+        ), cacheable=True)
+        self.register_task(TASK_GUARDIAN_PROFILE, lambda payload, warnings: self.guardian_profile(
+            payload.get("agent_states"),
+            payload.get("drift"),
+            payload.get("coherence"),
+            payload.get("anomaly"),
+            payload.get("temporal"),
+            payload.get("meta"),
+            warnings=warnings,
+        ), cacheable=True)
 
-# ------------------------------------------------------------
-# Guardian-Methoden an Orchestrator anhängen
-# ------------------------------------------------------------
-def _guardian_full(
-    self,
-    agent_states,
-    drift,
-    coherence,
-    anomaly,
-    temporal,
-    meta,
-    *,
-    warnings=None,
-):
-    warnings = warnings or []
-    agent_name = "guardian"
-    task = "guardian_full"
-
-    # Safe-Call benutzt dieselbe Logik wie alle Agenten
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {
-            "agent_states": agent_states,
-            "drift": drift,
-            "coherence": coherence,
-            "anomaly": anomaly,
-            "temporal": temporal,
-            "meta": meta,
-        },
-        warnings,
-    )
+    # ------------------------------------------------------------
+    # Guardian-Methoden
+    # ------------------------------------------------------------
+    def guardian_full(
+        self,
+        agent_states,
+        drift,
+        coherence,
+        anomaly,
+        temporal,
+        meta,
+        *,
+        warnings=None,
+    ):
+        warnings = [] if warnings is None else warnings
+        agent_name = "guardian"
+        task = "guardian_full"
 
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
+        # Safe-Call benutzt dieselbe Logik wie alle Agenten
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name,
+            task,
+            {
+                "agent_states": agent_states,
+                "drift": drift,
+                "coherence": coherence,
+                "anomaly": anomaly,
+                "temporal": temporal,
+                "meta": meta,
+            },
+            warnings,
         )
 
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
+        if out is None:
+            return _err(warnings, agent_name, task)
 
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
 
-def _guardian_profile(
-    self,
-    agent_states,
-    drift,
-    coherence,
-    anomaly,
-    temporal,
-    meta,
-    *,
-    warnings=None,
-):
-    warnings = warnings or []
-    agent_name = "guardian"
-    task = "guardian_profile"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {
-            "agent_states": agent_states,
-            "drift": drift,
-            "coherence": coherence,
-            "anomaly": anomaly,
-            "temporal": temporal,
-            "meta": meta,
-        },
-        warnings,
-    )
+    def guardian_profile(
+        self,
+        agent_states,
+        drift,
+        coherence,
+        anomaly,
+        temporal,
+        meta,
+        *,
+        warnings=None,
+    ):
+        warnings = [] if warnings is None else warnings
+        agent_name = "guardian"
+        task = "guardian_profile"
 
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
+        out, warnings, diagnostics = self._safe_call_agent(
+            agent_name,
+            task,
+            {
+                "agent_states": agent_states,
+                "drift": drift,
+                "coherence": coherence,
+                "anomaly": anomaly,
+                "temporal": temporal,
+                "meta": meta,
+            },
+            warnings,
         )
 
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
+        if out is None:
+            return _err(warnings, agent_name, task)
 
+        return _ok(out.get("result"), warnings, diagnostics, agent_name, task)
 
-# ------------------------------------------------------------
-# Monkey-Patching aktivieren
-# ------------------------------------------------------------
-Orchestrator._register_default_agents = _register_default_agents_with_guardian
-Orchestrator.run_task = _run_task_with_guardian
-Orchestrator.guardian_full = _guardian_full
-Orchestrator.guardian_profile = _guardian_profile
 
 # ======================================================================
 # ENDE GUARDIANAGENT-PATCH
@@ -619,8 +948,8 @@ Saham-Lab Orchestrator Erweiterung (ein Guss, zero Schnipsel)
 
 Fügt hinzu:
     - Registrierung:  agents["cluster"]
-    - Tasks:          "cluster_full", "cluster_profile"
-    - Methoden:       Orchestrator.cluster_full / cluster_profile
+    - Tasks:          "cluster_full", "cluster_profile", "cluster_combined"
+    - Methoden:       SahamOrchestrator.cluster_full / cluster_profile / cluster_combined
 """
 
 # ------------------------------------------------------------
@@ -631,147 +960,50 @@ try:
 except ImportError:
     from cluster_agent import ClusterAgent
 
+# Agent-Tasks + Payload-Schema (Keys + Defaults der Dispatch-Tabelle)
+_CLUSTER_ARGS = {"values": None, "k": 3}
+_CLUSTER_TASKS = (TASK_CLUSTER_FULL, TASK_CLUSTER_PROFILE, TASK_CLUSTER_COMBINED)
 
-# ------------------------------------------------------------
-# Originalmethoden sichern
-# ------------------------------------------------------------
-_original_register_default_agents_C = Orchestrator._register_default_agents
-_original_run_task_C = Orchestrator.run_task
-
-
-# ------------------------------------------------------------
-# Erweiterte Agent-Registrierung
-# ------------------------------------------------------------
-def _register_default_agents_with_cluster(self):
-    """
-    Ruft zuerst die vorhandene Registrierung auf,
-    ergänzt danach Agent 13: 'cluster'.
-    """
-    _original_register_default_agents_C(self)
-
-    try:
-        self.agents["cluster"] = ClusterAgent()
-    except Exception as e:
-        print("[WARN] ClusterAgent registration failed:", e)
-
-
-# ------------------------------------------------------------
-# Dispatcher-Erweiterung
-# ------------------------------------------------------------
-def _run_task_with_cluster(self, task_name: str, payload: dict):
-    warnings = []
-
-    # Cluster-Tasks zuerst abfangen
-    try:
-        if task_name == "cluster_full":
-            return self.cluster_full(
-                payload.get("values"),
-                payload.get("k", 3),
-                warnings=warnings,
-            )
-
-        if task_name == "cluster_profile":
-            return self.cluster_profile(
-                payload.get("values"),
-                payload.get("k", 3),
-                warnings=warnings,
-            )
-
-    except Exception as e:
-        warnings.append({"source": "cluster_dispatch", "reason": str(e)})
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent="cluster",
-            task=task_name,
-        )
-
-    # Alle anderen Tasks wie bisher
-    return _original_run_task_C(self, task_name, payload)
 
+class ClusterMixin:
+    """ClusterAgent-Erweiterung für den Orchestrator (siehe SahamOrchestrator)."""
 
-# ------------------------------------------------------------
-# Cluster-Methoden an Orchestrator anhängen
-# ------------------------------------------------------------
-def _cluster_full(self, values, k=3, *, warnings=None):
-    """
-    Vollständige Clusteranalyse für eine Zahlenfolge.
-    """
-    warnings = warnings or []
-    agent_name = "cluster"
-    task = "cluster_full"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"values": values, "k": k},
-        warnings,
-    )
-
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
-
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
-
-
-def _cluster_profile(self, values, k=3, *, warnings=None):
-    """
-    Kompakte Profilansicht der Clusterstruktur.
-    """
-    warnings = warnings or []
-    agent_name = "cluster"
-    task = "cluster_profile"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"values": values, "k": k},
-        warnings,
-    )
+    # ------------------------------------------------------------
+    # Registrierung
+    # ------------------------------------------------------------
+    def _register_default_agents(self):
+        """
+        Kooperative Registrierung (super()): ergänzt Agent 13: 'cluster' samt Tasks.
+        """
+        super()._register_default_agents()
 
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
+        self.register_agent("cluster", ClusterAgent)
 
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
+        # Tasks in die Dispatch-Tabelle eintragen
+        self._register_agent_tasks("cluster", _CLUSTER_TASKS, _CLUSTER_ARGS)
 
+    # ------------------------------------------------------------
+    # Cluster-Methoden
+    # ------------------------------------------------------------
+    def cluster_full(self, values, k=3, *, warnings=None):
+        """
+        Vollständige Clusteranalyse für eine Zahlenfolge.
+        """
+        return self._dispatch_simple("cluster", "cluster_full", {"values": values, "k": k}, warnings)
+
+    def cluster_profile(self, values, k=3, *, warnings=None):
+        """
+        Kompakte Profilansicht der Clusterstruktur.
+        """
+        return self._dispatch_simple("cluster", "cluster_profile", {"values": values, "k": k}, warnings)
+
+    def cluster_combined(self, values, k=3, *, warnings=None):
+        """
+        cluster_full + cluster_profile aus einem Agent-Aufruf:
+        result = {"full": ..., "profile": ...}.
+        """
+        return self._dispatch_simple("cluster", "cluster_combined", {"values": values, "k": k}, warnings)
 
-# ------------------------------------------------------------
-# Monkey-Patching aktivieren
-# ------------------------------------------------------------
-Orchestrator._register_default_agents = _register_default_agents_with_cluster
-Orchestrator.run_task = _run_task_with_cluster
-Orchestrator.cluster_full = _cluster_full
-Orchestrator.cluster_profile = _cluster_profile
 
 # ======================================================================
 # ENDE CLUSTERAGENT-PATCH
@@ -785,8 +1017,8 @@ Saham-Lab Orchestrator-Erweiterung (Ein Guss, zero Schnipsel)
 
 Fügt hinzu:
     - Registrierung:  agents["horizon"]
-    - Tasks:          "horizon_full", "horizon_profile", "horizon_forecast"
-    - Methoden:       Orchestrator.horizon_full / horizon_profile / horizon_forecast
+    - Tasks:          "horizon_full", "horizon_profile", "horizon_forecast", "horizon_combined"
+    - Methoden:       SahamOrchestrator.horizon_full / horizon_profile / horizon_forecast / horizon_combined
 """
 
 # ------------------------------------------------------------
@@ -797,190 +1029,61 @@ try:
 except ImportError:
     from horizon_agent import HorizonAgent
 
-
-# ------------------------------------------------------------
-# Originalmethoden sichern
-# ------------------------------------------------------------
-_original_register_default_agents_H = Orchestrator._register_default_agents
-_original_run_task_H = Orchestrator.run_task
-
-
-# ------------------------------------------------------------
-# Erweiterte Agent-Registrierung
-# ------------------------------------------------------------
-def _register_default_agents_with_horizon(self):
-    """
-    Ruft zuerst die vorhandene Registrierung auf,
-    ergänzt danach Agent 15: 'horizon'.
-    """
-    _original_register_default_agents_H(self)
-
-    try:
-        self.agents["horizon"] = HorizonAgent()
-    except Exception as e:
-        print("[WARN] HorizonAgent registration failed:", e)
-
-
-# ------------------------------------------------------------
-# Dispatcher-Erweiterung
-# ------------------------------------------------------------
-def _run_task_with_horizon(self, task_name: str, payload: dict):
-    warnings = []
-
-    # Horizon-Tasks zuerst abfangen
-    try:
-        if task_name == "horizon_full":
-            return self.horizon_full(
-                payload.get("errors", []),
-                payload.get("threshold", 1.0),
-                warnings=warnings,
-            )
-
-        if task_name == "horizon_profile":
-            return self.horizon_profile(
-                payload.get("errors", []),
-                payload.get("threshold", 1.0),
-                warnings=warnings,
-            )
-
-        if task_name == "horizon_forecast":
-            return self.horizon_forecast(
-                payload.get("errors", []),
-                payload.get("threshold", 1.0),
-                warnings=warnings,
-            )
-
-    except Exception as e:
-        warnings.append({"source": "horizon_dispatch", "reason": str(e)})
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent="horizon",
-            task=task_name,
-        )
-
-    # Alle anderen Tasks wie bisher
-    return _original_run_task_H(self, task_name, payload)
+# Agent-Tasks + Payload-Schema (Keys + Defaults der Dispatch-Tabelle)
+_HORIZON_ARGS = {"errors": _EMPTY, "threshold": 1.0}
+_HORIZON_TASKS = (
+    TASK_HORIZON_FULL,
+    TASK_HORIZON_PROFILE,
+    TASK_HORIZON_FORECAST,
+    TASK_HORIZON_COMBINED,
+)
 
 
-# ------------------------------------------------------------
-# Horizon-Methoden an Orchestrator anhängen
-# ------------------------------------------------------------
-def _horizon_full(self, errors, threshold=1.0, *, warnings=None):
-    """
-    Vollständige Horizontanalyse für eine Fehlersequenz.
-    """
-    warnings = warnings or []
-    agent_name = "horizon"
-    task = "horizon_full"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"errors": errors, "threshold": threshold},
-        warnings,
-    )
+class HorizonMixin:
+    """HorizonAgent-Erweiterung für den Orchestrator (siehe SahamOrchestrator)."""
 
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
-
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
-
-
-def _horizon_profile(self, errors, threshold=1.0, *, warnings=None):
-    """
-    Kompakte Profilansicht des Horizonts (ohne Forecast).
-    """
-    warnings = warnings or []
-    agent_name = "horizon"
-    task = "horizon_profile"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"errors": errors, "threshold": threshold},
-        warnings,
-    )
-
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
-
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
-
-
-def _horizon_forecast(self, errors, threshold=1.0, *, warnings=None):
-    """
-    Forecast, wann der Threshold voraussichtlich gerissen wird.
-    """
-    warnings = warnings or []
-    agent_name = "horizon"
-    task = "horizon_forecast"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"errors": errors, "threshold": threshold},
-        warnings,
-    )
+    # ------------------------------------------------------------
+    # Registrierung
+    # ------------------------------------------------------------
+    def _register_default_agents(self):
+        """
+        Kooperative Registrierung (super()): ergänzt Agent 15: 'horizon' samt Tasks.
+        """
+        super()._register_default_agents()
 
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
+        self.register_agent("horizon", HorizonAgent)
 
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
+        # Tasks in die Dispatch-Tabelle eintragen
+        self._register_agent_tasks("horizon", _HORIZON_TASKS, _HORIZON_ARGS)
 
+    # ------------------------------------------------------------
+    # Horizon-Methoden
+    # ------------------------------------------------------------
+    def horizon_full(self, errors, threshold=1.0, *, warnings=None):
+        """
+        Vollständige Horizontanalyse für eine Fehlersequenz.
+        """
+        return self._dispatch_simple("horizon", "horizon_full", {"errors": errors, "threshold": threshold}, warnings)
+
+    def horizon_profile(self, errors, threshold=1.0, *, warnings=None):
+        """
+        Kompakte Profilansicht des Horizonts (ohne Forecast).
+        """
+        return self._dispatch_simple("horizon", "horizon_profile", {"errors": errors, "threshold": threshold}, warnings)
+
+    def horizon_forecast(self, errors, threshold=1.0, *, warnings=None):
+        """
+        Forecast, wann der Threshold voraussichtlich gerissen wird.
+        """
+        return self._dispatch_simple("horizon", "horizon_forecast", {"errors": errors, "threshold": threshold}, warnings)
+
+    def horizon_combined(self, errors, threshold=1.0, *, warnings=None):
+        """
+        horizon_full + horizon_profile aus einem Agent-Aufruf:
+        result = {"full": ..., "profile": ...}.
+        """
+        return self._dispatch_simple("horizon", "horizon_combined", {"errors": errors, "threshold": threshold}, warnings)
 
-# ------------------------------------------------------------
-# Monkey-Patching aktivieren
-# ------------------------------------------------------------
-Orchestrator._register_default_agents = _register_default_agents_with_horizon
-Orchestrator.run_task = _run_task_with_horizon
-Orchestrator.horizon_full = _horizon_full
-Orchestrator.horizon_profile = _horizon_profile
-Orchestrator.horizon_forecast = _horizon_forecast
 
 # ======================================================================
 # ENDE HORIZONAGENT-PATCH
@@ -994,8 +1097,10 @@ Saham-Lab Orchestrator-Erweiterung (Ein Guss, zero Schnipsel)
 
 Fügt hinzu:
     - Registrierung:  agents["trend"]
-    - Tasks:          "trend_full", "trend_profile", "trend_forecast"
-    - Methoden:       Orchestrator.trend_full / trend_profile / trend_forecast
+    - Tasks:          "trend_full", "trend_profile", "trend_forecast", "trend_combined",
+                      "trend_stream"
+    - Methoden:       SahamOrchestrator.trend_full / trend_profile / trend_forecast / trend_combined
+                      / trend_stream
 """
 
 # ------------------------------------------------------------
@@ -1006,187 +1111,102 @@ try:
 except ImportError:
     from trend_agent import TrendAgent
 
+# Agent-Tasks + Payload-Schema (Keys + Defaults der Dispatch-Tabelle)
+_TREND_ARGS = {"values": _EMPTY}
+_TREND_TASKS = (TASK_TREND_FULL, TASK_TREND_PROFILE, TASK_TREND_FORECAST, TASK_TREND_COMBINED)
 
-# ------------------------------------------------------------
-# Originalmethoden sichern
-# ------------------------------------------------------------
-_original_register_default_agents_T = Orchestrator._register_default_agents
-_original_run_task_T = Orchestrator.run_task
-
-
-# ------------------------------------------------------------
-# Erweiterte Agent-Registrierung
-# ------------------------------------------------------------
-def _register_default_agents_with_trend(self):
-    """
-    Ruft zuerst die vorhandene Registrierung auf,
-    ergänzt danach Agent 18: 'trend'.
-    """
-    _original_register_default_agents_T(self)
-
-    try:
-        self.agents["trend"] = TrendAgent()
-    except Exception as e:
-        print("[WARN] TrendAgent registration failed:", e)
-
-
-# ------------------------------------------------------------
-# Dispatcher-Erweiterung
-# ------------------------------------------------------------
-def _run_task_with_trend(self, task_name: str, payload: dict):
-    warnings = []
+# TrendAgent.trend_full liest nur die letzten 50 Werte (größtes Fenster w50);
+# mehr muss ein Stream nicht vorhalten
+TREND_STREAM_WINDOW = 50
 
-    # Trend-Tasks zuerst abfangen
-    try:
-        if task_name == "trend_full":
-            return self.trend_full(
-                payload.get("values", []),
-                warnings=warnings,
-            )
-
-        if task_name == "trend_profile":
-            return self.trend_profile(
-                payload.get("values", []),
-                warnings=warnings,
-            )
-
-        if task_name == "trend_forecast":
-            return self.trend_forecast(
-                payload.get("values", []),
-                warnings=warnings,
-            )
-
-    except Exception as e:
-        warnings.append({"source": "trend_dispatch", "reason": str(e)})
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent="trend",
-            task=task_name,
-        )
 
-    # Alle anderen Tasks wie bisher
-    return _original_run_task_T(self, task_name, payload)
+class TrendMixin:
+    """TrendAgent-Erweiterung für den Orchestrator (siehe SahamOrchestrator)."""
 
-
-# ------------------------------------------------------------
-# Trend-Methoden an Orchestrator anhängen
-# ------------------------------------------------------------
-def _trend_full(self, values, *, warnings=None):
-    """
-    Vollständige Trendanalyse (Multi-Window + Phase + Score).
-    """
-    warnings = warnings or []
-    agent_name = "trend"
-    task = "trend_full"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"values": values},
-        warnings,
-    )
-
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
-
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
-
-
-def _trend_profile(self, values, *, warnings=None):
-    """
-    Kompakte Trendprofil-Sicht (Regime, Phase, Score).
-    """
-    warnings = warnings or []
-    agent_name = "trend"
-    task = "trend_profile"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"values": values},
-        warnings,
-    )
-
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
-            warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
-
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
-
-
-def _trend_forecast(self, values, *, warnings=None):
-    """
-    Forecast des Trends (Forward-Projektion auf Basis der TrendEngine).
-    """
-    warnings = warnings or []
-    agent_name = "trend"
-    task = "trend_forecast"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent_name,
-        task,
-        {"values": values},
-        warnings,
-    )
-
-    if out is None:
-        return self._wrap(
-            ok=False,
-            result=None,
+    # ------------------------------------------------------------
+    # Registrierung
+    # ------------------------------------------------------------
+    def _register_default_agents(self):
+        """
+        Kooperative Registrierung (super()): ergänzt Agent 18: 'trend' samt Tasks.
+        """
+        super()._register_default_agents()
+
+        self.register_agent("trend", TrendAgent)
+
+        # Tasks in die Dispatch-Tabelle eintragen
+        self._register_agent_tasks("trend", _TREND_TASKS, _TREND_ARGS)
+        # zustandsbehaftet -> nicht cachebar
+        self.register_task(TASK_TREND_STREAM, lambda payload, warnings: self.trend_stream(
+            payload.get("stream_id"), payload.get("values"), reset=bool(payload.get("reset")),
             warnings=warnings,
-            diagnostics=None,
-            agent=agent_name,
-            task=task,
-        )
-
-    return self._wrap(
-        ok=True,
-        result=out.get("result"),
-        warnings=warnings,
-        diagnostics=diagnostics,
-        agent=agent_name,
-        task=task,
-    )
+        ))
 
+    # ------------------------------------------------------------
+    # Trend-Methoden
+    # ------------------------------------------------------------
+    def trend_full(self, values, *, warnings=None):
+        """
+        Vollständige Trendanalyse (Multi-Window + Phase + Score).
+        """
+        return self._dispatch_simple("trend", "trend_full", {"values": values}, warnings)
+
+    def trend_profile(self, values, *, warnings=None):
+        """
+        Kompakte Trendprofil-Sicht (Regime, Phase, Score).
+        """
+        return self._dispatch_simple("trend", "trend_profile", {"values": values}, warnings)
+
+    def trend_forecast(self, values, *, warnings=None):
+        """
+        Forecast des Trends (Forward-Projektion auf Basis der TrendEngine).
+        """
+        return self._dispatch_simple("trend", "trend_forecast", {"values": values}, warnings)
+
+    def trend_combined(self, values, *, warnings=None):
+        """
+        trend_full + trend_profile aus einem Agent-Aufruf:
+        result = {"full": ..., "profile": ...}.
+        """
+        return self._dispatch_simple("trend", "trend_combined", {"values": values}, warnings)
+
+    def trend_stream(self, stream_id, values, *, reset=False, warnings=None):
+        """
+        Online-Variante von trend_full: values enthält nur die neuen Punkte
+        des Streams stream_id. Gehalten werden die letzten TREND_STREAM_WINDOW
+        Werte – das Ergebnis entspricht trend_full über die gesamte Historie,
+        kostet pro Tick aber O(Fenster) statt O(N).
+        reset=True beginnt den Stream neu.
+        """
+        warnings = [] if warnings is None else warnings
+        # ohne stream_id landeten alle Aufrufer im selben Stream ("trend", None)
+        if stream_id is None or stream_id == "":
+            warnings.append({"source": "trend_stream", "reason": "missing stream_id"})
+            return _err(warnings, "trend", "trend_stream")
+        # vor dem Anhängen prüfen – ungültige Punkte dürfen den Stream nicht vergiften
+        try:
+            new = [float(v) for v in (values or ())]
+        except (TypeError, ValueError) as e:
+            warnings.append({"source": "trend_stream", "reason": str(e)})
+            return _err(warnings, "trend", "trend_stream")
+        key = ("trend", stream_id)
+
+        with self._stream_lock:
+            tail = None if reset else self._stream_state.get(key)
+            if tail is None:
+                tail = self._stream_state[key] = deque(maxlen=TREND_STREAM_WINDOW)
+                if len(self._stream_state) > STREAM_STATE_SIZE:
+                    self._stream_state.popitem(last=False)
+            else:
+                self._stream_state.move_to_end(key)
+            tail.extend(new)
+            window = list(tail)
+
+        out, warnings, diagnostics = self._safe_call_agent("trend", "trend_full", {"values": window}, warnings)
+        if out is None:
+            return _err(warnings, "trend", "trend_stream")
+        return _ok(out.get("result"), warnings, diagnostics, "trend", "trend_stream")
 
-# ------------------------------------------------------------
-# Monkey-Patching aktivieren
-# ------------------------------------------------------------
-Orchestrator._register_default_agents = _register_default_agents_with_trend
-Orchestrator.run_task = _run_task_with_trend
-Orchestrator.trend_full = _trend_full
-Orchestrator.trend_profile = _trend_profile
-Orchestrator.trend_forecast = _trend_forecast
 
 # ======================================================================
 # ENDE TRENDAGENT-PATCH
@@ -1204,10 +1224,12 @@ Fügt hinzu:
          * forecast_full
          * forecast_profile
          * forecast_scenarios
+         * forecast_combined
     - Methoden:
-         * Orchestrator.forecast_full(...)
-         * Orchestrator.forecast_profile(...)
-         * Orchestrator.forecast_scenarios(...)
+         * SahamOrchestrator.forecast_full(...)
+         * SahamOrchestrator.forecast_profile(...)
+         * SahamOrchestrator.forecast_scenarios(...)
+         * SahamOrchestrator.forecast_combined(...)
 """
 
 # ------------------------------------------------------------
@@ -1218,140 +1240,143 @@ try:
 except ImportError:
     from forecast_agent import ForecastAgent
 
+# Agent-Tasks + Payload-Schema (Keys + Defaults der Dispatch-Tabelle)
+_FORECAST_ARGS = {"values": _EMPTY, "horizon": 10}
+_FORECAST_TASKS = (
+    TASK_FORECAST_FULL,
+    TASK_FORECAST_PROFILE,
+    TASK_FORECAST_SCENARIOS,
+    TASK_FORECAST_COMBINED,
+)
 
-# ------------------------------------------------------------
-# Originalmethoden sichern
-# ------------------------------------------------------------
-_original_register_default_agents_FC = Orchestrator._register_default_agents
-_original_run_task_FC = Orchestrator.run_task
 
+class ForecastMixin:
+    """ForecastAgent-Erweiterung für den Orchestrator (siehe SahamOrchestrator)."""
 
-# ------------------------------------------------------------
-# Erweiterte Agent-Registrierung
-# ------------------------------------------------------------
-def _register_default_agents_with_forecast(self):
-    """
-    Ruft zuerst die ursprüngliche Registrierung auf,
-    ergänzt danach Agent 12: 'forecast'.
-    """
-    _original_register_default_agents_FC(self)
-
-    try:
-        self.agents["forecast"] = ForecastAgent()
-    except Exception as e:
-        print("[WARN] ForecastAgent registration failed:", e)
+    # ------------------------------------------------------------
+    # Registrierung
+    # ------------------------------------------------------------
+    def _register_default_agents(self):
+        """
+        Kooperative Registrierung (super()): ergänzt Agent 12: 'forecast' samt Tasks.
+        """
+        super()._register_default_agents()
 
+        self.register_agent("forecast", ForecastAgent)
 
-# ------------------------------------------------------------
-# Dispatcher-Erweiterung (Task-Routing)
-# ------------------------------------------------------------
-def _run_task_with_forecast(self, task_name: str, payload: dict):
-    warnings = []
+        # Tasks in die Dispatch-Tabelle eintragen
+        self._register_agent_tasks("forecast", _FORECAST_TASKS, _FORECAST_ARGS)
 
-    # Neue Forecast-Tasks abfangen
-    try:
-        if task_name == "forecast_full":
-            return self.forecast_full(
-                payload.get("values", []),
-                payload.get("horizon", 10),
-                warnings=warnings,
-            )
+    # ------------------------------------------------------------
+    # Forecast-Methoden
+    # ------------------------------------------------------------
+    def forecast_full(self, values, horizon=10, *, warnings=None):
+        return self._dispatch_simple("forecast", "forecast_full", {"values": values, "horizon": horizon}, warnings)
 
-        if task_name == "forecast_profile":
-            return self.forecast_profile(
-                payload.get("values", []),
-                payload.get("horizon", 10),
-                warnings=warnings,
-            )
+    def forecast_profile(self, values, horizon=10, *, warnings=None):
+        return self._dispatch_simple("forecast", "forecast_profile", {"values": values, "horizon": horizon}, warnings)
 
-        if task_name == "forecast_scenarios":
-            return self.forecast_scenarios(
-                payload.get("values", []),
-                payload.get("horizon", 10),
-                warnings=warnings,
-            )
+    def forecast_scenarios(self, values, horizon=10, *, warnings=None):
+        return self._dispatch_simple("forecast", "forecast_scenarios", {"values": values, "horizon": horizon}, warnings)
 
-    except Exception as e:
-        warnings.append({"source": "forecast_dispatch", "reason": str(e)})
-        return self._wrap(
-            ok=False,
-            result=None,
-            diagnostics=None,
-            warnings=warnings,
-            agent="forecast",
-            task=task_name,
-        )
+    def forecast_combined(self, values, horizon=10, *, warnings=None):
+        """
+        forecast_full + forecast_profile aus einem Agent-Aufruf:
+        result = {"full": ..., "profile": ...}.
+        """
+        return self._dispatch_simple("forecast", "forecast_combined", {"values": values, "horizon": horizon}, warnings)
 
-    # Alles andere geht an den Original-Dispatcher
-    return _original_run_task_FC(self, task_name, payload)
 
+# ======================================================================
+# ENDE FORECASTAGENT-PATCH
+# ======================================================================
 
-# ------------------------------------------------------------
-# Forecast-Methoden an Orchestrator anhängen
-# ------------------------------------------------------------
-def _forecast_full(self, values, horizon=10, *, warnings=None):
-    warnings = warnings or []
-    agent = "forecast"
-    task = "forecast_full"
-
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent,
-        task,
-        {"values": values, "horizon": horizon},
-        warnings,
-    )
-
-    if out is None:
-        return self._wrap(False, None, warnings, None, agent, task)
-
-    return self._wrap(True, out["result"], warnings, diagnostics, agent, task)
 
+# ======================================================================
+# SAHAM-ORCHESTRATOR – Kern + alle Agent-Erweiterungen
+# ======================================================================
+class SahamOrchestrator(
+    ForecastMixin,
+    TrendMixin,
+    HorizonMixin,
+    ClusterMixin,
+    GuardianMixin,
+    DriftMixin,
+    Orchestrator,
+):
+    """
+    Orchestrator 0.7 mit Drift-, Guardian-, Cluster-, Horizon-, Trend- und
+    Forecast-Erweiterung. Die Mixins registrieren kooperativ über die MRO
+    (Kern zuerst, dann Drift … Forecast) – keine Klassenmutation zur Laufzeit.
+    """
 
-def _forecast_profile(self, values, horizon=10, *, warnings=None):
-    warnings = warnings or []
-    agent = "forecast"
-    task = "forecast_profile"
 
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent,
-        task,
-        {"values": values, "horizon": horizon},
-        warnings,
-    )
+# ======================================================================
+# CELERY-BACKEND (optional)
+# ======================================================================
+# Ein Orchestrator pro Worker-Prozess (Agenten nur einmal instanziieren)
+_WORKER_ORCHESTRATOR = None
 
-    if out is None:
-        return self._wrap(False, None, warnings, None, agent, task)
 
-    return self._wrap(True, out["result"], warnings, diagnostics, agent, task)
+def _worker_orchestrator() -> SahamOrchestrator:
+    global _WORKER_ORCHESTRATOR
+    if _WORKER_ORCHESTRATOR is None:
+        _WORKER_ORCHESTRATOR = SahamOrchestrator()
+    return _WORKER_ORCHESTRATOR
 
 
-def _forecast_scenarios(self, values, horizon=10, *, warnings=None):
-    warnings = warnings or []
-    agent = "forecast"
-    task = "forecast_scenarios"
+if HAVE_CELERY:
+    _CELERY_BROKER = os.getenv("SAHAM_CELERY_BROKER", "redis://localhost:6379/0")
 
-    out, warnings, diagnostics = self._safe_call_agent(
-        agent,
-        task,
-        {"values": values, "horizon": horizon},
-        warnings,
+    celery_app = Celery(
+        "saham_orchestrator",
+        broker=_CELERY_BROKER,
+        backend=os.getenv("SAHAM_CELERY_BACKEND", _CELERY_BROKER),
     )
 
-    if out is None:
-        return self._wrap(False, None, warnings, None, agent, task)
-
-    return self._wrap(True, out["result"], warnings, diagnostics, agent, task)
-
+    # Payloads/Ergebnisse per orjson (de)serialisieren, falls vorhanden
+    if HAVE_ORJSON:
+        from kombu.serialization import register as _register_serializer
 
-# ------------------------------------------------------------
-# Monkey-Patching aktivieren
-# ------------------------------------------------------------
-Orchestrator._register_default_agents = _register_default_agents_with_forecast
-Orchestrator.run_task = _run_task_with_forecast
-Orchestrator.forecast_full = _forecast_full
-Orchestrator.forecast_profile = _forecast_profile
-Orchestrator.forecast_scenarios = _forecast_scenarios
+        _register_serializer(
+            "orjson",
+            dumps_result,
+            loads_result,
+            content_type="application/x-orjson",
+            content_encoding="binary",
+        )
+        celery_app.conf.update(
+            task_serializer="orjson",
+            result_serializer="orjson",
+            accept_content=["orjson", "json"],
+        )
 
-# ======================================================================
-# ENDE FORECASTAGENT-PATCH
-# ======================================================================
+    @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+    def run_orchestrator_task(self, task_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Celery-Worker-Einstieg: synchroner run_task im Worker-Prozess."""
+        try:
+            # deserialisierte Tasknamen sind nicht interniert
+            res = _worker_orchestrator().run_task(sys.intern(task_name), payload)
+        except Exception as e:
+            raise self.retry(exc=e)
+        # Serialisierungsgrenze: Dict-Form (inkl. aufgelöster Diagnose)
+        return res.to_dict()
+else:
+    celery_app = None
+    run_orchestrator_task = None
+
+
+# ----------------------------------------------------------------------
+# Optional: Direktstart-Selbsttest (manueller Aufruf)
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    import numpy as np
+
+    a = np.arange(4.0)
+    assert _payload_fingerprint({"data": a}) == _payload_fingerprint({"data": a.copy()})
+    assert _payload_fingerprint({"data": a}) != _payload_fingerprint({"data": a + 1})
+    # Regression: object-Arrays werden nicht gecacht (Rohbytes = Objektzeiger)
+    assert _payload_fingerprint({"data": np.array([1, "x"], dtype=object)}) is None
+    assert _payload_fingerprint({"data": [1, 2]}) is not None
+
+    print("orchestrator_logic3: Selbsttest OK")
@@ -3,6 +3,22 @@ PointDynamics Kernel v0.1
 Reine mathematische Logik ohne Tools oder OpenAI.
 """
 
+# NumPy (optional, vektorisierte Differenzen)
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# Numba (optional, fusionierter Kernel für float64-Serien)
+try:
+    from numba import njit
+    HAVE_NUMBA = HAVE_NUMPY
+except ImportError:
+    njit = None
+    HAVE_NUMBA = False
+
 def pd_rate(series):
     return [series[i+1] - series[i] for i in range(len(series)-1)]
 
@@ -16,6 +32,52 @@ def pd_impact(series):
     # Beispielhafte Impact-Metrik
     return sum(abs(series[i+1] - series[i]) for i in range(len(series)-1))
 
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _pd_fused(arr):
+        """
+        rate/velocity/acceleration/impact in einem Durchlauf (len(arr) >= 3).
+        """
+        n = arr.shape[0]
+        rate = np.empty(n - 1)
+        velocity = np.empty(n - 2)
+        acceleration = np.empty(n - 3)
+        impact = 0.0
+        for i in range(n - 1):
+            r = arr[i + 1] - arr[i]
+            rate[i] = r
+            impact += abs(r)
+            if i >= 1:
+                v = r - rate[i - 1]
+                velocity[i - 1] = v
+                if i >= 2:
+                    acceleration[i - 2] = v - velocity[i - 2]
+        return rate, velocity, acceleration, impact
+
+def _pd_numpy(series):
+    """
+    rate/velocity/acceleration/impact über np.diff in float64.
+    None, wenn series kein rein numerisches 1-D-Array ergibt (-> Listen-Pfad).
+    """
+    arr = np.asarray(series)
+    if arr.ndim != 1 or arr.dtype.kind not in "iuf":
+        return None
+    # int64-Differenzen laufen still über ([2**62, -2**62, ...]) -> immer float64,
+    # auch gemischte int/float-Serien liefern so einheitlich floats
+    arr = arr.astype(np.float64, copy=False)
+
+    if HAVE_NUMBA:
+        rate, velocity, acceleration, impact = _pd_fused(arr)
+        return rate.tolist(), velocity.tolist(), acceleration.tolist(), impact
+
+    rate = np.diff(arr)
+    velocity = np.diff(rate)
+    acceleration = np.diff(velocity)
+    impact = np.abs(rate).sum().item()
+
+    # Listen erst an der Grenze (JSON-Serialisierung)
+    return rate.tolist(), velocity.tolist(), acceleration.tolist(), impact
+
 def pd_kernel_pipeline(data):
     """
     Hauptpipeline der mathematischen Kernlogik.
@@ -26,10 +88,14 @@ def pd_kernel_pipeline(data):
     if not isinstance(series, list) or len(series) < 3:
         return {"error": "series must be a list with >= 3 elements"}
 
-    rate = pd_rate(series)
-    velocity = pd_velocity(rate)
-    acceleration = pd_acceleration(velocity)
-    impact = pd_impact(series)
+    fast = _pd_numpy(series) if HAVE_NUMPY else None
+    if fast is not None:
+        rate, velocity, acceleration, impact = fast
+    else:
+        rate = pd_rate(series)
+        velocity = pd_velocity(rate)
+        acceleration = pd_acceleration(velocity)
+        impact = pd_impact(series)
 
     return {
         "rate": rate,
@@ -21,14 +21,28 @@ Tool-Calls werden lokal ausgeführt
 import os
 import sys
 import json
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import Any, Dict, List
 
 # 2) Third-Party
 from loguru import logger
 
+# orjson (optional, schnellere Serialisierung von Inputs/Tool-Ergebnissen)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None
+    HAVE_ORJSON = False
+
 # 3) Saham-Lab Modules
 from multi_agents.openai_config import (
     get_client,
+    get_async_client,
     SAHAM_ENABLE_OPENAI,
 )
 
@@ -49,6 +63,9 @@ from orchestrator_logic import (
     build_system_prompt,
 )
 
+# Exakter Antwort-Cache
+from orchestrator_cache import LLMCache, SemanticCache, cache_key, HAVE_SENTENCE_TRANSFORMERS
+
 
 # =========================================================
 #  PYTHON TOOL EXECUTION REGISTRY
@@ -81,11 +98,40 @@ ALL_TOOLS: List[Dict[str, Any]] = (
     + TEMPORALSYNTH_TOOLS
 )
 
+# Systemprompt ist statisch -> einmal beim Import bauen
+SYSTEM_PROMPT: str = build_system_prompt()
+
 
 # =========================================================
 #  INTERNES AUSFÜHRUNGSSYSTEM FÜR TOOLS
 # =========================================================
 
+# max. parallel ausgeführte Tool-Calls je Modellantwort
+MAX_TOOL_WORKERS = int(os.getenv("SAHAM_MAX_TOOL_CONCURRENCY", "8"))
+
+# Zeitlimit je Tool-Call (Sekunden, ab Ausführungsbeginn); danach bekommt das
+# Modell {"error": "timeout"}
+TOOL_TIMEOUT_S = float(os.getenv("SAHAM_TOOL_TIMEOUT_S", "5"))
+
+# Gesamtfrist für die Tool-Calls eines Turns (Sekunden, ab Warten auf die
+# Ergebnisse). 0 = TOOL_TIMEOUT_S je Welle à MAX_TOOL_WORKERS Calls: reicht,
+# solange jeder Call sein Limit einhält; greift, wenn hängende Tools alle
+# Worker belegen und wartende Calls nie starten.
+TOOL_TURN_TIMEOUT_S = float(os.getenv("SAHAM_TOOL_TURN_TIMEOUT_S", "0"))
+
+def _dumps(obj: Any) -> str:
+    """
+    JSON-String für Nachrichten-Content; orjson, sonst json.
+    Was orjson ablehnt (Nicht-String-Keys, >64-Bit-Ints) läuft über json.
+    Wirft TypeError, wenn obj gar nicht serialisierbar ist.
+    """
+    if HAVE_ORJSON:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False)
+
 def _execute_tool_locally(name: str, arguments: Any) -> Dict[str, Any]:
     """
     Führt ein Python-Tool lokal aus, ohne OpenAI.
@@ -120,12 +166,622 @@ def _execute_tool_locally(name: str, arguments: Any) -> Dict[str, Any]:
         return {"error": f"Toolfehler: {e}"}
 
     try:
-        json.dumps(result)
+        _dumps(result)
         return result
     except TypeError:
         return {"result": str(result)}
 
 
+def _run_tool_call(call) -> Dict[str, Any]:
+    # Chat Completions: call.function.{name,arguments}; Responses API: direkt am Item
+    fn = getattr(call, "function", call)
+    logger.info(f"Tool wird ausgeführt: {fn.name}")
+    return _execute_tool_locally(fn.name, fn.arguments)
+
+
+def _timeout_result(call) -> Dict[str, Any]:
+    name = getattr(call, "function", call).name
+    logger.error(f"Tool {name} nach {TOOL_TIMEOUT_S}s abgebrochen (Timeout).")
+    return {"error": "timeout"}
+
+
+def _turn_timeout(n_calls: int) -> float:
+    if TOOL_TURN_TIMEOUT_S > 0:
+        return TOOL_TURN_TIMEOUT_S
+    waves = -(-n_calls // max(1, MAX_TOOL_WORKERS))
+    return TOOL_TIMEOUT_S * max(1, waves)
+
+
+_PENDING = object()
+
+
+class _ToolRun:
+    """
+    Ein Tool-Call im Pool. Die Frist TOOL_TIMEOUT_S läuft ab Ausführungsbeginn
+    (started), nicht ab Submit: Calls in der Warteschlange verbrauchen sie nicht.
+    """
+
+    __slots__ = ("call", "started", "result", "future")
+
+    def __init__(self, ex: ThreadPoolExecutor, call, cond: threading.Condition) -> None:
+        self.call = call
+        self.started = None
+        self.result = _PENDING
+        self.future = ex.submit(self._run, cond)
+
+    def _run(self, cond: threading.Condition) -> None:
+        with cond:
+            self.started = time.monotonic()
+        try:
+            result = _run_tool_call(self.call)
+        except Exception as e:
+            logger.exception(f"Fehler bei Tool-Call {self.call}")
+            result = {"error": f"Toolfehler: {e}"}
+        with cond:
+            self.result = result
+            cond.notify_all()
+
+
+def _tool_results(runs: List[_ToolRun], cond: threading.Condition) -> List[Dict[str, Any]]:
+    """
+    Ergebnisse in Call-Reihenfolge. Was TOOL_TIMEOUT_S nach seinem Start nicht
+    fertig ist – oder bei Ablauf der Turn-Frist noch läuft bzw. wartet –,
+    wird {"error": "timeout"}.
+    """
+    turn_deadline = time.monotonic() + _turn_timeout(len(runs))
+    results: List[Any] = [_PENDING] * len(runs)
+    pending = len(runs)
+    with cond:
+        while pending:
+            now = time.monotonic()
+            wake = turn_deadline
+            for i, run in enumerate(runs):
+                if results[i] is not _PENDING:
+                    continue
+                if run.result is not _PENDING:
+                    results[i] = run.result
+                elif now >= turn_deadline or (
+                    run.started is not None and now >= run.started + TOOL_TIMEOUT_S
+                ):
+                    run.future.cancel()
+                    results[i] = _timeout_result(run.call)
+                else:
+                    if run.started is not None:
+                        wake = min(wake, run.started + TOOL_TIMEOUT_S)
+                    continue
+                pending -= 1
+            if pending:
+                cond.wait(wake - now)
+    return results
+
+
+def _tool_pool(n_calls: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max(1, min(n_calls, MAX_TOOL_WORKERS)))
+
+
+def _close_tool_pool(ex: ThreadPoolExecutor) -> None:
+    # nicht auf hängende Tools warten (Threads laufen im Hintergrund aus).
+    # Achtung: concurrent.futures joint seine Worker beim Interpreter-Exit –
+    # ein hängendes Tool verzögert also weiterhin das Prozessende.
+    ex.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_tool_call_async(call, limit: asyncio.Semaphore) -> Dict[str, Any]:
+    # Tools sind synchron -> Thread je Call; limit begrenzt die Parallelität.
+    # Frist ab Ausführungsbeginn, das Warten auf einen Slot zählt nicht mit
+    async with limit:
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(_run_tool_call, call), TOOL_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            return _timeout_result(call)
+
+
+async def _tool_results_async(tool_calls, tasks) -> List[Dict[str, Any]]:
+    """Wie _tool_results: Task-Ergebnisse in Call-Reihenfolge unter der Turn-Frist."""
+    if not tasks:
+        return []
+    done, pending = await asyncio.wait(tasks, timeout=_turn_timeout(len(tasks)))
+    for task in pending:
+        task.cancel()
+    return [
+        task.result() if task in done else _timeout_result(call)
+        for call, task in zip(tool_calls, tasks)
+    ]
+
+
+class _StreamedToolCalls:
+    """
+    Sammelt Tool-Call-Deltas eines Phase-1-Streams (stream=True).
+
+    Ein Call gilt als vollständig, sobald seine Argumente ein geschlossenes
+    JSON-Objekt ergeben – danach kann der Stream nichts mehr anhängen –
+    spätestens aber am Stream-Ende (finish). Vollständige Calls haben dieselbe
+    Form wie Chat-Tool-Calls (call.id, call.function.name/arguments).
+    """
+
+    def __init__(self) -> None:
+        self._content: List[str] = []
+        self._parts: Dict[int, Dict[str, str]] = {}
+        self._calls: Dict[int, Any] = {}
+
+    def feed(self, chunk) -> List[tuple]:
+        """Delta verarbeiten; liefert neu vollständige (index, call)."""
+        if not chunk.choices:
+            return []
+        delta = chunk.choices[0].delta
+        if delta.content:
+            self._content.append(delta.content)
+
+        ready = []
+        for tc in delta.tool_calls or ():
+            part = self._parts.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+            if tc.id:
+                part["id"] = tc.id
+            if tc.function is not None:
+                part["name"] += tc.function.name or ""
+                part["arguments"] += tc.function.arguments or ""
+            if tc.index not in self._calls and self._is_complete(part):
+                ready.append((tc.index, self._close(tc.index)))
+        return ready
+
+    def finish(self) -> List[tuple]:
+        """Stream-Ende: alle noch offenen Calls abschließen."""
+        return [
+            (index, self._close(index))
+            for index in sorted(self._parts)
+            if index not in self._calls
+        ]
+
+    def tool_calls(self) -> List[Any]:
+        return [self._calls[index] for index in sorted(self._calls)]
+
+    def message(self) -> Dict[str, Any]:
+        """Assistant-Nachricht (Tool-Wahl) für Phase 3."""
+        msg: Dict[str, Any] = {"role": "assistant", "content": "".join(self._content) or None}
+        calls = self.tool_calls()
+        if calls:
+            msg["tool_calls"] = [
+                {
+                    "id": call.id,
+                    "type": "function",
+                    "function": {"name": call.function.name, "arguments": call.function.arguments},
+                }
+                for call in calls
+            ]
+        return msg
+
+    @staticmethod
+    def _is_complete(part: Dict[str, str]) -> bool:
+        args = part["arguments"].rstrip()
+        if not (part["id"] and part["name"] and args.endswith("}")):
+            return False
+        try:
+            return isinstance(json.loads(args), dict)
+        except json.JSONDecodeError:
+            return False
+
+    def _close(self, index: int) -> Any:
+        part = self._parts[index]
+        call = SimpleNamespace(
+            id=part["id"],
+            type="function",
+            function=SimpleNamespace(name=part["name"], arguments=part["arguments"]),
+        )
+        self._calls[index] = call
+        return call
+
+
+class _SyncChunks:
+    """Synchroner Stream als async-Iterator, der nie suspendiert."""
+
+    def __init__(self, stream) -> None:
+        self._it = iter(stream)
+
+    def __aiter__(self) -> "_SyncChunks":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _SyncPhaseIO:
+    """
+    Phasen-Adapter für den synchronen Client: Modell-Calls direkt,
+    Tool-Calls im Thread-Pool (_ToolRun). Die async-Methoden suspendieren
+    nie – _run_sync führt die Phasen daher ohne Event-Loop aus.
+    """
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self._ex = None
+        self._cond = threading.Condition()
+
+    async def call(self, create, **kwargs) -> Any:
+        return create(**kwargs)
+
+    def chunks(self, stream) -> _SyncChunks:
+        return _SyncChunks(stream)
+
+    def start(self, call) -> _ToolRun:
+        if self._ex is None:
+            self._ex = _tool_pool(MAX_TOOL_WORKERS)
+        return _ToolRun(self._ex, call, self._cond)
+
+    async def results(self, tool_calls, runs) -> List[Dict[str, Any]]:
+        try:
+            return _tool_results(runs, self._cond)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._ex is not None:
+            _close_tool_pool(self._ex)
+            self._ex = None
+
+
+class _AsyncPhaseIO:
+    """
+    Phasen-Adapter für AsyncOpenAI: Modell-Calls werden awaitet,
+    Tool-Calls laufen als Tasks (Thread je Call, max. MAX_TOOL_WORKERS).
+    """
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self._limit = asyncio.Semaphore(MAX_TOOL_WORKERS)
+
+    async def call(self, create, **kwargs) -> Any:
+        return await create(**kwargs)
+
+    def chunks(self, stream) -> Any:
+        return stream
+
+    def start(self, call) -> "asyncio.Task":
+        return asyncio.create_task(_run_tool_call_async(call, self._limit))
+
+    async def results(self, tool_calls, tasks) -> List[Dict[str, Any]]:
+        return await _tool_results_async(tool_calls, tasks)
+
+    def close(self) -> None:
+        pass
+
+
+def _run_sync(coro) -> Any:
+    """Phasen-Koroutine mit _SyncPhaseIO in einem Schritt ausführen."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("Phasen-Koroutine hat suspendiert – nur mit _SyncPhaseIO aufrufen.")
+
+
+# =========================================================
+#  NACHRICHTEN-AUFBAU (sync + async)
+# =========================================================
+
+MODEL = "gpt-4.1-mini"
+
+# Exakter Antwort-Cache: opt-in (SAHAM_ENABLE_CACHE=1), nur für deterministische Läufe
+SAHAM_ENABLE_CACHE = os.getenv("SAHAM_ENABLE_CACHE", "0") == "1"
+LLM_CACHE = LLMCache()
+
+# Semantischer Cache (opt-in: SAHAM_ENABLE_SEMANTIC_CACHE=1) – greift nach einem
+# Exakt-Miss, z.B. für dieselbe Serie mit minimalem numerischem Jitter
+SAHAM_ENABLE_SEMANTIC_CACHE = os.getenv("SAHAM_ENABLE_SEMANTIC_CACHE", "0") == "1"
+SEMANTIC_CACHE = None
+if SAHAM_ENABLE_SEMANTIC_CACHE:
+    if HAVE_SENTENCE_TRANSFORMERS:
+        SEMANTIC_CACHE = SemanticCache()
+    else:
+        logger.warning("SAHAM_ENABLE_SEMANTIC_CACHE gesetzt, aber sentence-transformers fehlt.")
+
+# Inputs je Modellaufruf in run_orchestrator_batch (Overhead vs. Antwortqualität)
+BATCH_SIZE = 8
+
+# Phase 1 streamen und Tools schon während der Generierung starten
+# (Standard an; SAHAM_STREAM_TOOL_CALLS=0 -> klassisch nacheinander)
+SAHAM_STREAM_TOOL_CALLS = os.getenv("SAHAM_STREAM_TOOL_CALLS", "1") == "1"
+
+# Responses API (opt-in: SAHAM_USE_RESPONSES_API=1): Phase 3 setzt per
+# previous_response_id auf Phase 1 auf und sendet nur die Tool-Ergebnisse,
+# statt Systemprompt + Input + Tool-Call erneut zu übertragen
+SAHAM_USE_RESPONSES_API = os.getenv("SAHAM_USE_RESPONSES_API", "0") == "1"
+
+# Responses API erwartet Function-Tools flach (ohne "function"-Hülle)
+RESPONSES_TOOLS: List[Dict[str, Any]] = [
+    {"type": "function", **tool["function"]} for tool in ALL_TOOLS
+]
+
+
+def _offline_response() -> Dict[str, Any]:
+    logger.warning("OpenAI deaktiviert – Offline-Ausführung aktiv.")
+    return {
+        "offline_mode": True,
+        "note": "OpenAI ist deaktiviert. Toolausführung lokal möglich.",
+        "tools_available": list(PYTHON_TOOL_REGISTRY.keys()),
+    }
+
+
+def _build_messages(user_input: Any) -> List[Dict[str, Any]]:
+    pipeline = determine_pipeline_for_input(detect_input_type(user_input))
+
+    return _wrap_messages(
+        "Hier ist der Input fuer das Saham-Lab-System:\n"
+        f"{_dumps(user_input)}\n\n"
+        "Nutze Tools, um eine strukturierte Auswertung zu liefern.",
+        pipeline,
+    )
+
+
+def _build_batch_messages(inputs: List[Any]) -> List[Dict[str, Any]]:
+    # Pipelines aller Zeilen, Reihenfolge erhalten, ohne Duplikate
+    pipeline = list(dict.fromkeys(
+        step
+        for user_input in inputs
+        for step in (determine_pipeline_for_input(detect_input_type(user_input)) or [])
+    ))
+
+    rows = "\n---\n".join(
+        f"[ROW {i}]\n{_dumps(user_input)}"
+        for i, user_input in enumerate(inputs)
+    )
+
+    # Formatvorgabe im User-Block: bleibt auch in Phase 3 erhalten
+    return _wrap_messages(
+        f"Hier sind {len(inputs)} unabhängige Inputs fuer das Saham-Lab-System:\n"
+        f"{rows}\n\n"
+        "Nutze Tools, um jede Zeile strukturiert auszuwerten. Antworte am Ende "
+        'ausschliesslich mit JSON der Form {"rows": [...]} – genau ein Eintrag '
+        "je [ROW i], in derselben Reihenfolge.",
+        pipeline,
+    )
+
+
+def _wrap_messages(user_content: str, pipeline) -> List[Dict[str, Any]]:
+    """
+    Feste Reihenfolge [system, system(pipeline), user]: Systemprompt + Tools
+    bilden einen byte-identischen Präfix (Prompt-Prefix-Caching beim Anbieter),
+    der Pipeline-Slot fehlt nie, nur der User-Block variiert.
+    """
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {
+            "role": "system",
+            "content": "Vorgeschlagene Pipeline: " + (", ".join(pipeline) if pipeline else "(none)"),
+        },
+        {"role": "user", "content": user_content},
+    ]
+
+
+def _final_messages(messages, first_msg, tool_calls, results) -> List[Any]:
+    tool_messages = [
+        {
+            "role": "tool",
+            "tool_call_id": call.id,
+            "name": call.function.name,
+            "content": _dumps(result),
+        }
+        for call, result in zip(tool_calls, results)
+    ]
+
+    return [
+        *messages,    # system, pipeline, input – gleicher Präfix wie Phase 1
+        first_msg,    # tool choice
+        *tool_messages,
+    ]
+
+
+async def _chat_phases(io, messages, final_kwargs) -> Any:
+    """
+    Phasen 1–3 über Chat Completions – eine Implementierung für sync und
+    async; io (_SyncPhaseIO/_AsyncPhaseIO) führt Modell- und Tool-Calls aus.
+    """
+    create = io.client.chat.completions.create
+
+    if SAHAM_STREAM_TOOL_CALLS:
+        # PHASE 1 + 2 überlappend: jeder Tool-Call startet, sobald seine
+        # Argumente vollständig sind, während das Modell noch generiert
+        stream = await io.call(
+            create,
+            model=MODEL,
+            messages=messages,
+            tools=ALL_TOOLS,
+            tool_choice="auto",
+            stream=True,
+        )
+
+        acc = _StreamedToolCalls()
+        runs: Dict[int, Any] = {}
+        async for chunk in io.chunks(stream):
+            for index, call in acc.feed(chunk):
+                runs[index] = io.start(call)
+        for index, call in acc.finish():
+            runs[index] = io.start(call)
+
+        first_msg, tool_calls = acc.message(), acc.tool_calls()
+        results = await io.results(tool_calls, [runs[index] for index in sorted(runs)])
+    else:
+        # ---------------------------
+        # PHASE 1 – TOOL PLANUNG
+        # ---------------------------
+        first = await io.call(
+            create,
+            model=MODEL,
+            messages=messages,
+            tools=ALL_TOOLS,
+            tool_choice="auto",
+        )
+
+        first_msg = first.choices[0].message
+        tool_calls = first_msg.tool_calls or []
+
+        # ---------------------------
+        # PHASE 2 – TOOL AUSFÜHRUNG (nebenläufig)
+        # ---------------------------
+        results = await io.results(tool_calls, [io.start(call) for call in tool_calls])
+
+    # ---------------------------
+    # PHASE 3 – ENDANTWORT
+    # ---------------------------
+    second = await io.call(
+        create,
+        model=MODEL,
+        messages=_final_messages(messages, first_msg, tool_calls, results),
+        **final_kwargs,
+    )
+
+    return second.choices[0].message.content
+
+
+def _responses_final_kwargs(final_kwargs) -> Dict[str, Any]:
+    # response_format (Chat) -> text.format (Responses)
+    kwargs = dict(final_kwargs)
+    response_format = kwargs.pop("response_format", None)
+    if response_format is not None:
+        kwargs["text"] = {"format": response_format}
+    return kwargs
+
+
+def _responses_tool_calls(first) -> List[Any]:
+    return [item for item in first.output if item.type == "function_call"]
+
+
+def _responses_tool_outputs(tool_calls, results) -> List[Dict[str, Any]]:
+    return [
+        {
+            "type": "function_call_output",
+            "call_id": call.call_id,
+            "output": _dumps(result),
+        }
+        for call, result in zip(tool_calls, results)
+    ]
+
+
+async def _responses_phases(io, messages, final_kwargs) -> Any:
+    """
+    Wie _chat_phases, aber über die Responses API: Phase 3 referenziert
+    Phase 1 per previous_response_id und sendet nur die Tool-Ausgaben.
+    """
+    create = io.client.responses.create
+    # Formatvorgabe auch in Phase 1: wählt das Modell keine Tools, ist deren
+    # Ausgabe bereits die Endantwort
+    format_kwargs = _responses_final_kwargs(final_kwargs)
+
+    # PHASE 1 – TOOL PLANUNG
+    first = await io.call(
+        create,
+        model=MODEL,
+        input=messages,
+        tools=RESPONSES_TOOLS,
+        tool_choice="auto",
+        **format_kwargs,
+    )
+
+    tool_calls = _responses_tool_calls(first)
+    if not tool_calls:
+        # keine Tools gewählt -> Phase 1 ist bereits die Endantwort
+        return first.output_text
+
+    # PHASE 2 – TOOL AUSFÜHRUNG (nebenläufig)
+    results = await io.results(tool_calls, [io.start(call) for call in tool_calls])
+
+    # PHASE 3 – ENDANTWORT (nur Tool-Ausgaben, Kontext liegt serverseitig)
+    second = await io.call(
+        create,
+        model=MODEL,
+        previous_response_id=first.id,
+        input=_responses_tool_outputs(tool_calls, results),
+        **format_kwargs,
+    )
+
+    return second.output_text
+
+
+def _run_phases_sync(phases, client, messages, final_kwargs) -> Any:
+    io = _SyncPhaseIO(client)
+    try:
+        return _run_sync(phases(io, messages, final_kwargs))
+    finally:
+        io.close()
+
+
+def _run_phases(client, messages, **final_kwargs) -> Any:
+    return _run_phases_sync(_chat_phases, client, messages, final_kwargs)
+
+
+def _run_phases_responses(client, messages, **final_kwargs) -> Any:
+    return _run_phases_sync(_responses_phases, client, messages, final_kwargs)
+
+
+async def _run_phases_async(client, messages, **final_kwargs) -> Any:
+    return await _chat_phases(_AsyncPhaseIO(client), messages, final_kwargs)
+
+
+async def _run_phases_responses_async(client, messages, **final_kwargs) -> Any:
+    return await _responses_phases(_AsyncPhaseIO(client), messages, final_kwargs)
+
+
+def _cache_lookup(messages) -> tuple:
+    """(key, Treffer) – erst exakt, dann semantisch; key None ohne Exakt-Cache."""
+    key = None
+    if SAHAM_ENABLE_CACHE:
+        key = cache_key(MODEL, messages, tools=ALL_TOOLS)
+        hit = LLM_CACHE.get(key)
+        if hit is not None:
+            logger.info("Antwort aus LLM-Cache.")
+            return key, hit
+
+    if SEMANTIC_CACHE is not None:
+        hit = SEMANTIC_CACHE.get(messages[-1]["content"])
+        if hit is not None:
+            logger.info("Antwort aus semantischem Cache.")
+            return key, hit
+
+    return key, None
+
+
+def _cache_store(key, messages, content) -> None:
+    if content is None:
+        return
+    if key is not None:
+        LLM_CACHE.set(key, content)
+    if SEMANTIC_CACHE is not None:
+        SEMANTIC_CACHE.set(messages[-1]["content"], content)
+
+
+async def _cache_lookup_async(messages) -> tuple:
+    # SemanticCache.get bettet per sentence-transformers ein (synchron,
+    # CPU-lastig) -> im Thread, damit der Event-Loop frei bleibt
+    if SEMANTIC_CACHE is None:
+        return _cache_lookup(messages)
+    return await asyncio.to_thread(_cache_lookup, messages)
+
+
+async def _cache_store_async(key, messages, content) -> None:
+    # wie _cache_lookup_async: SemanticCache.set bettet ebenfalls ein
+    if SEMANTIC_CACHE is None or content is None:
+        _cache_store(key, messages, content)
+        return
+    await asyncio.to_thread(_cache_store, key, messages, content)
+
+
+def _split_batch_answer(content: Any, n: int) -> List[Any]:
+    """{"rows": [...]} -> Liste mit n Einträgen; bei Formfehlern je Zeile ein error-dict."""
+    try:
+        rows = json.loads(content).get("rows")
+    except (TypeError, ValueError, AttributeError):
+        rows = None
+
+    if not isinstance(rows, list) or len(rows) != n:
+        logger.error("Batch-Antwort nicht im Format {\"rows\": [...]} mit passender Länge.")
+        return [{"error": "Batch-Antwort nicht parsebar", "raw": content} for _ in range(n)]
+
+    return rows
+
+
 # =========================================================
 #  HAUPTFUNKTION
 # =========================================================
@@ -148,92 +804,74 @@ def run_orchestrator(user_input: Any) -> Any:
     # OFFLINE-MODUS (NO OPENAI)
     # ---------------------------
     if not SAHAM_ENABLE_OPENAI:
-        logger.warning("OpenAI deaktiviert – Offline-Ausführung aktiv.")
-        return {
-            "offline_mode": True,
-            "note": "OpenAI ist deaktiviert. Toolausführung lokal möglich.",
-            "tools_available": list(PYTHON_TOOL_REGISTRY.keys()),
-        }
+        return _offline_response()
 
     # ---------------------------
     # ONLINE-MODUS (OPENAI)
     # ---------------------------
-    client = get_client()
-    system_prompt = build_system_prompt()
-
-    input_type = detect_input_type(user_input)
-    pipeline = determine_pipeline_for_input(input_type)
+    messages = _build_messages(user_input)
+    key, hit = _cache_lookup(messages)
+    if hit is not None:
+        return hit
 
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {
-            "role": "user",
-            "content": (
-                "Hier ist der Input fuer das Saham-Lab-System:\n"
-                f"{json.dumps(user_input, ensure_ascii=False)}\n\n"
-                "Nutze Tools, um eine strukturierte Auswertung zu liefern."
-            ),
-        },
-    ]
+    run_phases = _run_phases_responses if SAHAM_USE_RESPONSES_API else _run_phases
+    content = run_phases(get_client(), messages)
+    _cache_store(key, messages, content)
+    return content
 
-    if pipeline:
-        messages.append(
-            {
-                "role": "system",
-                "content": "Vorgeschlagene Pipeline: " + ", ".join(pipeline),
-            }
-        )
 
-    # ---------------------------
-    # PHASE 1 – TOOL PLANUNG
-    # ---------------------------
-    first = client.chat.completions.create(
-        model="gpt-4.1-mini",
-        messages=messages,
-        tools=ALL_TOOLS,
-        tool_choice="auto",
-    )
+def run_orchestrator_batch(inputs: List[Any], batch_size: int = BATCH_SIZE) -> List[Any]:
+    """
+    Wie run_orchestrator, aber für viele unabhängige Inputs: je bis zu
+    batch_size Inputs teilen sich einen Zwei-Phasen-Durchlauf (ein Prompt
+    mit [ROW i]-Blöcken, Antwort als {"rows": [...]}).
+    Ergebnisliste in Eingabereihenfolge.
+    """
 
-    first_msg = first.choices[0].message
-    tool_calls = first_msg.tool_calls or []
+    logger.info(f"Orchestrator-Batch gestartet ({len(inputs)} Inputs).")
 
-    tool_messages = []
+    if not SAHAM_ENABLE_OPENAI:
+        return [_offline_response() for _ in inputs]
 
-    # ---------------------------
-    # PHASE 2 – TOOL AUSFÜHRUNG
-    # ---------------------------
-    for call in tool_calls:
-        name = call.function.name
-        args = call.function.arguments
-
-        logger.info(f"Tool wird ausgeführt: {name}")
-        result = _execute_tool_locally(name, args)
-
-        tool_messages.append(
-            {
-                "role": "tool",
-                "tool_call_id": call.id,
-                "name": name,
-                "content": json.dumps(result, ensure_ascii=False),
-            }
+    client = get_client()
+    run_phases = _run_phases_responses if SAHAM_USE_RESPONSES_API else _run_phases
+    out: List[Any] = []
+
+    for i in range(0, len(inputs), max(1, batch_size)):
+        chunk = inputs[i:i + max(1, batch_size)]
+        content = run_phases(
+            client,
+            _build_batch_messages(chunk),
+            response_format={"type": "json_object"},
         )
+        out.extend(_split_batch_answer(content, len(chunk)))
 
-    # ---------------------------
-    # PHASE 3 – ENDANTWORT
-    # ---------------------------
-    messages2 = [
-        {"role": "system", "content": system_prompt},
-        messages[1],  # input
-        first_msg,    # tool choice
-        *tool_messages,
-    ]
+    return out
 
-    second = client.chat.completions.create(
-        model="gpt-4.1-mini",
-        messages=messages2,
-    )
 
-    return second.choices[0].message.content
+async def run_orchestrator_async(user_input: Any) -> Any:
+    """
+    Async-Variante von run_orchestrator (AsyncOpenAI).
+    Blockiert den Event-Loop während der Modell-Roundtrips nicht;
+    mehrere Aufrufe können sich einen Loop teilen.
+    """
+
+    logger.info("Orchestrator (async) gestartet.")
+    logger.debug(f"User Input: {user_input}")
+
+    if not SAHAM_ENABLE_OPENAI:
+        return _offline_response()
+
+    client = get_async_client()
+    messages = _build_messages(user_input)
+    key, hit = await _cache_lookup_async(messages)
+    if hit is not None:
+        return hit
+
+    run_phases = _run_phases_responses_async if SAHAM_USE_RESPONSES_API else _run_phases_async
+    content = await run_phases(client, messages)
+    await _cache_store_async(key, messages, content)
+    return content
 
 
 # =========================================================
@@ -40,14 +40,57 @@ Hinweis:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Tuple, Union
 import math
+import os
+import threading
+
+# NumPy (optional, vektorisierte Statistik/Z-Scores für lange Serien)
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
 
 
 Number = Union[int, float]
 Series = List[float]
 SeriesMap = Dict[str, Series]
 
+# Ab dieser Länge rechnen stats/zscores/detect in NumPy;
+# darunter überwiegt der Array-Overhead
+_NUMPY_MIN_LEN = 64
+
+# Z-Grenzen im Profil: eine geteilte Instanz für alle Serien (nur lesen).
+# Bewusst kein MappingProxyType – json/orjson serialisieren ihn nicht.
+_THRESHOLDS: Dict[str, float] = {
+    "z_mild": 1.5,
+    "z_moderate": 2.5,
+    "z_severe": 3.5,
+}
+
+# Schwere-Codes des Vektor-Pfads: 0/1/2 -> Label
+_SEVERITIES = ("mild", "moderate", "severe")
+
+# Pool für build_profile: Serien sind unabhängig, NumPy gibt in seinen
+# C-Kerneln den GIL frei. Lazy, von allen Agent-Instanzen geteilt.
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    thread_name_prefix="saham-anomaly",
+                )
+    return _EXECUTOR
+
 
 class AnomalyAgent:
     """
@@ -207,17 +250,34 @@ class AnomalyAgent:
                 "count": 0,
             }
 
-        s = sum(series)
-        mean = s / n
+        if HAVE_NUMPY and n >= _NUMPY_MIN_LEN:
+            a = np.asarray(series, dtype=np.float64)
+            return {
+                "mean": float(a.mean()),
+                "std": float(a.std()),
+                "min": float(a.min()),
+                "max": float(a.max()),
+                "count": n,
+            }
 
-        var = sum((x - mean) ** 2 for x in series) / n
-        std = math.sqrt(var)
+        # Welford: mean/M2/min/max in einem Durchlauf
+        mean = 0.0
+        m2 = 0.0
+        mn = mx = series[0]
+        for i, x in enumerate(series, 1):
+            delta = x - mean
+            mean += delta / i
+            m2 += delta * (x - mean)
+            if x < mn:
+                mn = x
+            elif x > mx:
+                mx = x
 
         return {
             "mean": mean,
-            "std": std,
-            "min": min(series),
-            "max": max(series),
+            "std": math.sqrt(m2 / n),
+            "min": mn,
+            "max": mx,
             "count": n,
         }
 
@@ -249,6 +309,9 @@ class AnomalyAgent:
         if std == 0.0:
             return [0.0 for _ in series]
 
+        if HAVE_NUMPY and n >= _NUMPY_MIN_LEN:
+            return ((np.asarray(series, dtype=np.float64) - mean) / std).tolist()
+
         return [(x - mean) / std for x in series]
 
     def zscores_for_all(
@@ -294,9 +357,30 @@ class AnomalyAgent:
         Nur Werte mit |z| >= z_min werden gemeldet.
         """
         anomalies: List[Dict[str, Any]] = []
-        for i, (x, z) in enumerate(zip(series, zscores)):
-            if abs(z) < z_min:
-                continue
+
+        if HAVE_NUMPY and len(zscores) >= _NUMPY_MIN_LEN:
+            # Schwelle + Schwere in einem Vektor-Durchlauf (Grenzen wie severity_from_z);
+            # nur die Treffer in Python anfassen
+            n = min(len(series), len(zscores))
+            az = np.abs(np.asarray(zscores[:n], dtype=np.float64))
+            hits = np.flatnonzero(az >= max(z_min, 1.5))
+            hit_az = az[hits]
+            codes = (hit_az >= 2.5).astype(np.int8) + (hit_az >= 3.5)
+            for i, c in zip(hits.tolist(), codes.tolist()):
+                anomalies.append(
+                    {
+                        "index": i,
+                        "value": series[i],
+                        "z": zscores[i],
+                        "severity": _SEVERITIES[c],
+                    }
+                )
+            return anomalies
+
+        candidates = (
+            (i, x, z) for i, (x, z) in enumerate(zip(series, zscores)) if abs(z) >= z_min
+        )
+        for i, x, z in candidates:
             severity = self.severity_from_z(z)
             if severity == "none":
                 continue
@@ -327,6 +411,41 @@ class AnomalyAgent:
             result[name] = anomalies
         return result
 
+    def analyze_series(
+        self,
+        series: Series,
+        *,
+        z_min: float = 1.5,
+    ) -> Tuple[Dict[str, float], Series, List[Dict[str, Any]]]:
+        """
+        stats -> zscores -> detect für eine einzelne Serie.
+        """
+        stats = self.compute_stats(series)
+        zscores = self.zscores_for_series(series, stats)
+        return stats, zscores, self.detect_anomalies_for_series(series, zscores, z_min=z_min)
+
+    def analyze_all(
+        self,
+        series_map: SeriesMap,
+        *,
+        z_min: float = 1.5,
+    ) -> Dict[str, Tuple[Dict[str, float], Series, List[Dict[str, Any]]]]:
+        """
+        analyze_series für alle Serien. Ab zwei NumPy-langen Serien parallel
+        im Thread-Pool, sonst sequentiell (Pool-Overhead > Gewinn).
+        """
+        names = list(series_map.keys())
+        long_series = sum(1 for seq in series_map.values() if len(seq) >= _NUMPY_MIN_LEN)
+
+        if HAVE_NUMPY and long_series >= 2:
+            results = _get_executor().map(
+                lambda name: self.analyze_series(series_map[name], z_min=z_min), names
+            )
+        else:
+            results = (self.analyze_series(series_map[name], z_min=z_min) for name in names)
+
+        return dict(zip(names, results))
+
     # ------------------------------------------------------------------
     # Stufe 5 – Profil aufbauen
     # ------------------------------------------------------------------
@@ -378,29 +497,20 @@ class AnomalyAgent:
         if with_debug:
             debug["series_normalized"] = normalized
 
-        # 3) Statistik
-        stats_map = self.stats_for_all(normalized)
+        # 3–5) Statistik, Z-Scores, Anomalien – je Serie ein Task
+        analyzed = self.analyze_all(normalized, z_min=1.5)
+        stats_map = {name: r[0] for name, r in analyzed.items()}
+        z_map = {name: r[1] for name, r in analyzed.items()}
+        anomalies_map = {name: r[2] for name, r in analyzed.items()}
         if with_debug:
             debug["stats"] = stats_map
-
-        # 4) Z-Scores
-        z_map = self.zscores_for_all(normalized, stats_map)
-        if with_debug:
             debug["zscores"] = z_map
-
-        # 5) Anomalien
-        anomalies_map = self.detect_anomalies_for_all(normalized, z_map, z_min=1.5)
-        if with_debug:
             debug["anomalies"] = anomalies_map
 
         # 6) Threshold-Info pro Serie (nur Z-Grenzen dokumentieren)
-        thresholds_map: Dict[str, Dict[str, float]] = {}
-        for name in series_map.keys():
-            thresholds_map[name] = {
-                "z_mild": 1.5,
-                "z_moderate": 2.5,
-                "z_severe": 3.5,
-            }
+        thresholds_map: Dict[str, Dict[str, float]] = {
+            name: _THRESHOLDS for name in series_map
+        }
         if with_debug:
             debug["thresholds"] = thresholds_map
 
@@ -16,11 +16,22 @@ from __future__ import annotations
 from typing import List, Dict, Any
 import math
 
+# NumPy (optional, vektorisiertes Binning für lange Serien)
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
 
-def _to_float_list(x: Any) -> List[float]:
-    if isinstance(x, list):
-        return [float(v) for v in x]
-    return []
+try:
+    from .series_input import to_float_list
+except ImportError:
+    from series_input import to_float_list
+
+# Ab dieser Länge bint _interval_clusters in NumPy;
+# darunter überwiegt der Array-Overhead
+_NUMPY_MIN_LEN = 64
 
 
 class ClusterAgent:
@@ -37,7 +48,7 @@ class ClusterAgent:
         with_debug=True,
         with_diagnostics=False,
     ):
-        values = _to_float_list(payload.get("values", []))
+        values = to_float_list(payload.get("values"))
         k = int(payload.get("k", 3))
 
         if task == "cluster_full":
@@ -58,6 +69,15 @@ class ClusterAgent:
                 "diagnostics": None,
             }
 
+        if task == "cluster_combined":
+            result, debug = self.cluster_combined(values, k, with_debug)
+            return {
+                "ok": True,
+                "result": result,
+                "debug": debug if with_debug else {},
+                "diagnostics": None,
+            }
+
         return {"ok": False, "result": None, "debug": {"error": f"unknown task {task}"}}
     # ---------------------------------------------------------
     # 1) Basisclusterung (Intervalle)
@@ -66,6 +86,9 @@ class ClusterAgent:
         if not values:
             return []
 
+        if HAVE_NUMPY and len(values) >= _NUMPY_MIN_LEN:
+            return self._bin_array(np.asarray(values, dtype=np.float64), k)
+
         k = max(1, k)
         vmin, vmax = min(values), max(values)
 
@@ -100,6 +123,55 @@ class ClusterAgent:
 
         return clusters
 
+    def _bin_array(self, a, k: int):
+        """
+        NumPy-Variante von _interval_clusters auf einem float64-Array (auch View).
+        Gleiche Bins und Ausgabe wie der Listen-Pfad, Statistik per bincount/reduceat.
+        """
+        if a.size == 0:
+            return []
+
+        k = max(1, k)
+        vmin, vmax = a.min().item(), a.max().item()
+
+        if vmin == vmax:
+            return [{
+                "id": 0,
+                "members": list(range(a.size)),
+                "centroid": vmin,
+                "spread": 0.0,
+                "t_range": (0, a.size-1),
+            }]
+
+        step = (vmax - vmin) / k
+        bins = np.minimum(((a - vmin) / step).astype(np.int64), k - 1)
+
+        counts = np.bincount(bins, minlength=k)
+        sums = np.bincount(bins, weights=a, minlength=k)
+
+        # stabil sortiert -> Mitglieder je Bin aufsteigend wie im Listen-Pfad
+        order = np.argsort(bins, kind="stable")
+        nonempty = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts[nonempty])[:-1]))
+        sorted_vals = a[order]
+        mins = np.minimum.reduceat(sorted_vals, starts)
+        maxs = np.maximum.reduceat(sorted_vals, starts)
+
+        members = np.split(order, starts[1:])
+        clusters = []
+        for j, cid in enumerate(nonempty.tolist()):
+            m = members[j].tolist()
+            n = len(m)
+            clusters.append({
+                "id": cid,
+                "members": m,
+                "centroid": float(sums[cid]) / n,
+                "spread": float(maxs[j] - mins[j]) if n > 1 else 0.0,
+                "t_range": (m[0], m[-1]),
+            })
+
+        return clusters
+
     # ---------------------------------------------------------
     # 2) Dynamik-Clustering (Ableitung)
     # ---------------------------------------------------------
@@ -127,9 +199,17 @@ class ClusterAgent:
     # 4) Full Pipeline
     # ---------------------------------------------------------
     def cluster_full(self, values: List[float], k: int, with_debug=True):
-        base_clusters = self._interval_clusters(values, k)
-        dyn_values = self._derivative(values)
-        dyn_clusters = self._interval_clusters(dyn_values, k)
+        if HAVE_NUMPY and len(values) >= _NUMPY_MIN_LEN:
+            # Basis + Ableitung auf einem Array; np.diff ersetzt die Zwischenliste
+            a = np.asarray(values, dtype=np.float64)
+            dyn = np.diff(a)
+            base_clusters = self._bin_array(a, k)
+            dyn_clusters = self._bin_array(dyn, k)
+            dyn_values = dyn.tolist() if with_debug else None
+        else:
+            base_clusters = self._interval_clusters(values, k)
+            dyn_values = self._derivative(values)
+            dyn_clusters = self._interval_clusters(dyn_values, k)
 
         strength = self._cluster_strength(base_clusters)
         stability = self._cluster_stability(base_clusters)
@@ -157,9 +237,17 @@ class ClusterAgent:
         return result, debug
     def build_profile(self, values: List[float], k: int, with_debug=True):
         full, dbg = self.cluster_full(values, k, with_debug)
+        return self._profile_view(full, k), dbg
+
+    def cluster_combined(self, values: List[float], k: int, with_debug=True):
+        # Full + Profil aus einer einzigen Clusterung
+        full, dbg = self.cluster_full(values, k, with_debug)
+        return {"full": full, "profile": self._profile_view(full, k)}, dbg
+
+    def _profile_view(self, full: Dict, k: int) -> Dict:
         # Profil = konzentrierte Sicht
         prof = full["ClusterProfile"]
-        profile = {
+        return {
             "ClusterProfile": {
                 "k": k,
                 "cluster_strength": prof["cluster_strength"],
@@ -169,7 +257,6 @@ class ClusterAgent:
                 "num_clusters": len(prof["clusters"]),
             }
         }
-        return profile, dbg
 
 
 if __name__ == "__main__":
@@ -29,6 +29,63 @@ from __future__ import annotations
 from typing import Any, Dict, List, Tuple
 import math
 
+# NumPy (optional, vektorisierte Kennwerte für lange Vektoren)
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# Numba (optional, JIT-Kernel für die Paar-Kohärenz großer Agentenmengen)
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = HAVE_NUMPY
+except ImportError:
+    njit = prange = None
+    HAVE_NUMBA = False
+
+# Ab dieser Länge rechnen normalize/strength in NumPy;
+# darunter überwiegt der Array-Overhead
+_NUMPY_MIN_LEN = 64
+
+# Ab so vielen Agenten rechnet die Paar-Kohärenz als Matrix-Kernel (NumPy),
+# ab _NUMBA_MIN_AGENTS ohne Paar-Temporaries im Numba-Kernel
+_NUMPY_MIN_AGENTS = 8
+_NUMBA_MIN_AGENTS = 32
+
+# np.var(..., mean=...) erst ab NumPy 2.0 – spart den zweiten Mittelwert-Durchlauf
+_NP_VAR_HAS_MEAN = HAVE_NUMPY and int(np.__version__.split(".")[0]) >= 2
+
+
+def _use_numpy(vec: Any) -> bool:
+    return HAVE_NUMPY and (isinstance(vec, np.ndarray) or len(vec) >= _NUMPY_MIN_LEN)
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _pairwise_njit(S, out):
+        """
+        Obere Dreiecksmatrix zeilenweise parallel, gespiegelt in out (Diagonale bleibt).
+        Gleiche Formel wie der NumPy-Pfad, ohne (Paare, K)-Zwischenarrays.
+        """
+        A, K = S.shape
+        for i in prange(A):
+            for j in range(i + 1, A):
+                acc = 0.0
+                for k in range(K):
+                    x = S[i, k]
+                    y = S[j, k]
+                    ax = abs(x)
+                    ay = abs(y)
+                    d = ax if ax > ay else ay
+                    if d < 1e-9:
+                        d = 1e-9
+                    acc += 1.0 - abs(x - y) / d
+                v = acc / K
+                out[i, j] = v
+                out[j, i] = v
+
 
 class CoherenceAgent:
     """
@@ -146,8 +203,14 @@ class CoherenceAgent:
         """
         Normiert einen Vektor auf den Bereich 0–1 über max-Wert.
         """
-        if not vec:
+        if len(vec) == 0:
             return [0.0]
+        if _use_numpy(vec):
+            a = np.asarray(vec, dtype=np.float64)
+            mx = np.abs(a).max()
+            if mx == 0:
+                return [0.0] * a.size
+            return (a / mx).tolist()
         mx = max(abs(v) for v in vec)
         if mx == 0:
             return [0.0 for _ in vec]
@@ -159,6 +222,68 @@ class CoherenceAgent:
         """
         return {name: self._normalize_vector(vec) for name, vec in collected.items()}
 
+    def collect_and_normalize(
+        self,
+        outputs: Dict[str, Any],
+        collected: Dict[str, List[float]] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        collect() + normalize() in einem Durchlauf je Agent (gleiche Regeln).
+
+        Lange numerische Vektoren entstehen direkt als float64-Array
+        (np.fromiter) und bleiben Arrays für strengths(); sonst Listen,
+        wobei max|v| schon beim Einsammeln mitläuft.
+        collected: optional, wird mit den Rohvektoren befüllt (Debug-Baum).
+        """
+        normalized: Dict[str, Any] = {}
+
+        for agent_name, out in outputs.items():
+            if isinstance(out, dict):
+                items = out.values()
+            elif isinstance(out, (list, tuple)):
+                items = out
+            else:
+                items = None
+
+            if items is not None and _use_numpy(items):
+                a = np.fromiter(
+                    (float(v) for v in items if isinstance(v, (int, float))),
+                    dtype=np.float64,
+                )
+                if a.size:
+                    if collected is not None:
+                        collected[agent_name] = a.tolist()
+                    mx = np.abs(a).max()
+                    normalized[agent_name] = a / mx if mx != 0 else np.zeros_like(a)
+                    continue
+                vals = [float(len(out))]
+                mx = vals[0]
+            elif items is not None:
+                vals = []
+                mx = None
+                for v in items:
+                    if isinstance(v, (int, float)):
+                        f = float(v)
+                        vals.append(f)
+                        # = max(abs(v) for v in vals), ohne zweiten Durchlauf
+                        av = abs(f)
+                        if mx is None or av > mx:
+                            mx = av
+                if not vals:
+                    # Fallback, falls keine numerischen Werte gefunden wurden
+                    vals = [float(len(out))]
+                    mx = vals[0]
+            else:
+                # alles andere -> String-Länge als Feature
+                vals = [float(len(str(out)))]
+                mx = vals[0]
+
+            if collected is not None:
+                collected[agent_name] = vals
+            normalized[agent_name] = [0.0 for _ in vals] if mx == 0 else [v / mx for v in vals]
+
+        return normalized
+
     # ------------------------------------------------------------------
     # Stufe 2 – Strengths (Stärkekennzahlen)
     # ------------------------------------------------------------------
@@ -171,7 +296,7 @@ class CoherenceAgent:
             - density  : Anteil Nicht-Null-Elemente
             - variance : Varianz
         """
-        if not vec:
+        if len(vec) == 0:
             return {
                 "l1": 0.0,
                 "l2": 0.0,
@@ -180,6 +305,19 @@ class CoherenceAgent:
                 "variance": 0.0,
             }
 
+        if _use_numpy(vec):
+            # je Kennwert eine C-Reduktion, Python-floats an der Grenze
+            a = np.asarray(vec, dtype=np.float64)
+            mean = a.mean()
+            variance = np.var(a, mean=mean) if _NP_VAR_HAS_MEAN else a.var()
+            return {
+                "l1": np.abs(a).sum().item(),
+                "l2": math.sqrt((a @ a).item()),
+                "mean": mean.item(),
+                "density": int(np.count_nonzero(a)) / a.size,
+                "variance": variance.item(),
+            }
+
         length = len(vec)
         l1 = sum(abs(v) for v in vec)
         l2 = math.sqrt(sum(v * v for v in vec))
@@ -220,7 +358,16 @@ class CoherenceAgent:
 
         Paar-Kohärenz = Durchschnitt über alle Kennzahlen.
         """
+        dense = self._coherence_matrix(strengths)
+        if dense is not None:
+            return self._matrix_to_dict(*dense)
+
         agents = list(strengths.keys())
+        keys = self._shared_keys(strengths)
+        if keys:
+            return self._pairwise_tuples(agents, keys, strengths)
+
+        # ungleiche Kennzahlen je Agent: allgemeiner Pfad
         matrix: Dict[str, Dict[str, float]] = {}
 
         for a in agents:
@@ -244,6 +391,97 @@ class CoherenceAgent:
 
         return matrix
 
+    @staticmethod
+    def _shared_keys(strengths: Dict[str, Dict[str, float]]) -> List[str]:
+        # Kennzahl-Schlüssel, falls alle Agenten dieselben (gleiche Reihenfolge) haben
+        if not strengths:
+            return []
+        rows = iter(strengths.values())
+        keys = list(next(rows))
+        for row in rows:
+            if list(row) != keys:
+                return []
+        return keys
+
+    @staticmethod
+    def _pairwise_tuples(
+        agents: List[str],
+        keys: List[str],
+        strengths: Dict[str, Dict[str, float]],
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Listen-Pfad bei gemeinsamen Kennzahlen: Werte einmal als Tupel,
+        innen nur Tupel-Iteration; symmetrisch -> nur i < j rechnen, dann spiegeln.
+        """
+        sv = [tuple(strengths[a][k] for k in keys) for a in agents]
+        n_keys = len(keys)
+        A = len(agents)
+        rows = [[1.0] * A for _ in range(A)]
+
+        for i in range(A):
+            si = sv[i]
+            row_i = rows[i]
+            for j in range(i + 1, A):
+                acc = 0.0
+                for x, y in zip(si, sv[j]):
+                    # = max(abs(x), abs(y), 1e-9)
+                    denom = abs(x)
+                    ay = abs(y)
+                    if ay > denom:
+                        denom = ay
+                    if 1e-9 > denom:
+                        denom = 1e-9
+                    acc += 1.0 - abs(x - y) / denom
+                row_i[j] = rows[j][i] = acc / n_keys
+
+        return {a: dict(zip(agents, row)) for a, row in zip(agents, rows)}
+
+    def _coherence_matrix(self, strengths: Dict[str, Dict[str, float]]):
+        """
+        NumPy-/Numba-Kernel für coherence_pairwise: (agents, M) mit M als (A, A)-Matrix.
+        None -> Listen-Pfad (wenige Agenten, kein NumPy, ungleiche Kennzahlen).
+        """
+        if not HAVE_NUMPY or len(strengths) < _NUMPY_MIN_AGENTS:
+            return None
+
+        keys = self._shared_keys(strengths)
+        if not keys:
+            return None
+        agents = list(strengths)
+
+        S = np.array([[strengths[a][k] for k in keys] for a in agents], dtype=np.float64)
+
+        if HAVE_NUMBA and len(agents) >= _NUMBA_MIN_AGENTS:
+            M = np.ones((len(agents), len(agents)))
+            _pairwise_njit(S, M)
+            return agents, M
+
+        absS = np.abs(S)
+
+        # Formel ist symmetrisch -> nur obere Dreiecksmatrix rechnen, dann spiegeln
+        i, j = np.triu_indices(len(agents), 1)
+        denom = np.maximum(np.maximum(absS[i], absS[j]), 1e-9)
+        scores = (1.0 - np.abs(S[i] - S[j]) / denom).mean(axis=1)
+
+        M = np.ones((len(agents), len(agents)))
+        M[i, j] = scores
+        M[j, i] = scores
+        return agents, M
+
+    @staticmethod
+    def _matrix_to_dict(agents: List[str], M) -> Dict[str, Dict[str, float]]:
+        # verschachteltes Dict erst an der Grenze
+        rows = M.tolist()
+        return {a: dict(zip(agents, row)) for a, row in zip(agents, rows)}
+
+    @staticmethod
+    def _global_from_matrix(M) -> float:
+        # Mittel der Off-Diagonale ohne Doppelschleife
+        A = M.shape[0]
+        if A < 2:
+            return 1.0
+        return ((M.sum() - np.trace(M)) / (A * (A - 1))).item()
+
     # ------------------------------------------------------------------
     # Stufe 4 – Globaler Kohärenz-Score
     # ------------------------------------------------------------------
@@ -286,24 +524,29 @@ class CoherenceAgent:
         """
         debug: Dict[str, Any] = {}
 
-        collected = self.collect(outputs)
-        if with_debug:
-            debug["collected"] = collected
+        collected: Dict[str, List[float]] | None = {} if with_debug else None
+        normalized_vecs = self.collect_and_normalize(outputs, collected)
 
-        normalized = self.normalize(collected)
+        # Arrays direkt in strengths(), Listen erst für Profil/Debug
+        strengths = self.strengths(normalized_vecs)
+        normalized = {
+            name: vec.tolist() if HAVE_NUMPY and isinstance(vec, np.ndarray) else vec
+            for name, vec in normalized_vecs.items()
+        }
         if with_debug:
+            debug["collected"] = collected
             debug["normalized"] = normalized
-
-        strengths = self.strengths(normalized)
-        if with_debug:
             debug["strengths"] = strengths
 
-        pairwise = self.coherence_pairwise(strengths)
+        dense = self._coherence_matrix(strengths)
+        if dense is not None:
+            pairwise = self._matrix_to_dict(*dense)
+            global_c = self._global_from_matrix(dense[1])
+        else:
+            pairwise = self.coherence_pairwise(strengths)
+            global_c = self.global_coherence(pairwise)
         if with_debug:
             debug["pairwise"] = pairwise
-
-        global_c = self.global_coherence(pairwise)
-        if with_debug:
             debug["global"] = global_c
 
         profile: Dict[str, Any] = {
@@ -152,6 +152,9 @@ def full_diagnostic(
     Voll-Diagnose Paket:
     - Debug-Integrität
     - optional Sequenz-/Multi-Agent-Analyse
+
+    Die Sequenzen werden nur gelesen; Aufrufer dürfen ihre Originale
+    (ohne Kopie) übergeben.
     """
     reports: List[Dict[str, Any]] = []
 
@@ -120,62 +120,53 @@ class DriftAgent:
     # ----------------------------------------------------------
     # Snapshot → StateVector
     # ----------------------------------------------------------
+    # Achse -> Pfad im Snapshot (Reihenfolge = Reihenfolge im StateVector);
+    # None = Sonderfall TemporalSynth (Signaturbetrag)
+    _PATHS = (
+        ("pattern", ("pattern", "summary", "nonzero")),            # PatternCore – Aktivität
+        ("structure", ("structure", "summary", "complexity")),     # StructureWeaver – Komplexität
+        ("points", ("points", "summary", "intensity")),            # PointEngine – Intensität
+        ("dynamics", ("dynamics", "summary", "dynamics")),         # PointDynamics – Dynamik-Level
+        ("temporal", None),                                        # TemporalSynth – Signaturbetrag
+        ("coherence", ("coherence", "summary", "coherence_score")),  # CoherenceAgent (0–1)
+        ("anomaly", ("anomaly", "summary", "total_anomalies")),    # AnomalyAgent – Anomaliezahl
+        ("fusion", ("fusion", "summary", "meta_score")),           # FusionAgent – MetaScore (0–1)
+    )
+
     def _safe_get(self, d: Dict[str, Any], *path, default: Optional[float] = None) -> Optional[float]:
         """
         Sicherer Zugriff auf verschachtelte Dicts.
+        Happy Path ohne Prüfung je Ebene; fehlende Keys / Nicht-Dicts -> default.
         """
-        cur: Any = d
-        for key in path:
-            if not isinstance(cur, dict) or key not in cur:
-                return default
-            cur = cur[key]
-        if isinstance(cur, (int, float)):
-            return float(cur)
+        try:
+            for key in path:
+                d = d[key]
+        except (KeyError, TypeError, IndexError):
+            return default
+        if isinstance(d, (int, float)):
+            return float(d)
         return default
 
+    def _temporal_signature(self, snapshot: Dict[str, Any]) -> float:
+        temporal = snapshot.get("temporal", {})
+        sig = temporal.get("ChronoMaps", {}).get("signature_vector")
+        if isinstance(sig, list) and sig:
+            return sum(abs(float(x)) for x in sig) / len(sig)
+        return 0.0
+
     def _extract_state_vector(self, snapshot: Dict[str, Any]) -> StateVector:
         """
         Extrahiert einen kompakten StateVector aus dem Snapshot.
         Alle Werte werden grob auf eine 0–10 Skala normiert.
         """
         sv: StateVector = {}
+        safe_get = self._safe_get
 
-        # PatternCore – Aktivität (Anzahl aktiver Punkte)
-        pattern = snapshot.get("pattern", {})
-        sv["pattern"] = self._safe_get(pattern, "summary", "nonzero", default=0.0) or 0.0
-
-        # StructureWeaver – Komplexität
-        structure = snapshot.get("structure", {})
-        sv["structure"] = self._safe_get(structure, "summary", "complexity", default=0.0) or 0.0
-
-        # PointEngine – Intensität
-        points = snapshot.get("points", {})
-        sv["points"] = self._safe_get(points, "summary", "intensity", default=0.0) or 0.0
-
-        # PointDynamics – Dynamik-Level
-        dynamics = snapshot.get("dynamics", {})
-        sv["dynamics"] = self._safe_get(dynamics, "summary", "dynamics", default=0.0) or 0.0
-
-        # TemporalSynth – vereinfachter Signaturbetrag
-        temporal = snapshot.get("temporal", {})
-        sig = temporal.get("ChronoMaps", {}).get("signature_vector")
-        if isinstance(sig, list) and sig:
-            sv["temporal"] = sum(abs(float(x)) for x in sig) / len(sig)
-        else:
-            sv["temporal"] = 0.0
-
-        # CoherenceAgent – Kohärenzwert (0–1)
-        coherence = snapshot.get("coherence", {})
-        sv["coherence"] = self._safe_get(coherence, "summary", "coherence_score", default=0.0) or 0.0
-
-        # AnomalyAgent – Anomaliedichte (Normierung über 10)
-        anomaly = snapshot.get("anomaly", {})
-        total_anoms = self._safe_get(anomaly, "summary", "total_anomalies", default=0.0) or 0.0
-        sv["anomaly"] = total_anoms
-
-        # FusionAgent – MetaScore (0–1)
-        fusion = snapshot.get("fusion", {})
-        sv["fusion"] = self._safe_get(fusion, "summary", "meta_score", default=0.0) or 0.0
+        for axis, path in self._PATHS:
+            if path is None:
+                sv[axis] = self._temporal_signature(snapshot)
+            else:
+                sv[axis] = safe_get(snapshot, *path, default=0.0) or 0.0
 
         return sv
     # ----------------------------------------------------------
@@ -15,20 +15,21 @@ API-Tasks:
     - forecast_full
     - forecast_profile
     - forecast_scenarios
+    - forecast_combined (full + profile aus einem Ensemble-Lauf)
 """
 
 from __future__ import annotations
 from typing import List, Dict, Any
 import math
 
+try:
+    from .series_input import to_float_list
+except ImportError:
+    from series_input import to_float_list
+
 # ------------------------------------------------------------
 # Hilfsfunktionen
 # ------------------------------------------------------------
-def _to_float_list(x):
-    if isinstance(x, list):
-        return [float(v) for v in x]
-    return []
-
 def _last(x: List[float], default=0.0):
     return x[-1] if x else default
 
@@ -60,7 +61,7 @@ class ForecastAgent:
         with_debug=True,
         with_diagnostics=False,
     ):
-        values = _to_float_list(payload.get("values", []))
+        values = to_float_list(payload.get("values"))
         horizon = int(payload.get("horizon", 10))
 
         if task == "forecast_full":
@@ -75,6 +76,10 @@ class ForecastAgent:
             result, dbg = self.forecast_scenarios(values, horizon)
             return {"ok": True, "result": result, "debug": dbg, "diagnostics": None}
 
+        if task == "forecast_combined":
+            result, dbg = self.forecast_combined(values, horizon)
+            return {"ok": True, "result": result, "debug": dbg, "diagnostics": None}
+
         return {
             "ok": False,
             "result": None,
@@ -289,7 +294,16 @@ class ForecastAgent:
     # ------------------------------------------------------------
     def forecast_profile(self, values, horizon):
         full, dbg = self.forecast_full(values, horizon)
-        profile = {
+        return self._profile_view(full), dbg
+
+    # ------------------------------------------------------------
+    def forecast_combined(self, values, horizon):
+        # 9 Modelle + Ensemble nur einmal rechnen, beide Sichten projizieren
+        full, dbg = self.forecast_full(values, horizon)
+        return {"full": full, "profile": self._profile_view(full)}, dbg
+
+    def _profile_view(self, full):
+        return {
             "ForecastProfile": {
                 "confidence": full["Confidence"],
                 "first": full["Forecast"][:5],
@@ -300,7 +314,6 @@ class ForecastAgent:
                 },
             }
         }
-        return profile, dbg
 
     # ------------------------------------------------------------
     def forecast_scenarios(self, values, horizon):
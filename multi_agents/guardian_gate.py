@@ -13,7 +13,17 @@ WICHTIG:
 - Er ist nur Türsteher: markieren, melden, aber nicht anfassen.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# Ab dieser Länge wird die Numerik-Prüfung in C (dtype-Scan) erledigt
+NUMPY_GATE_MIN_LEN = 1024
 
 
 def _gate_result(
@@ -99,6 +109,44 @@ def gate_array_input(
     )
 
 
+def gate_array_input_v2(
+    seq: Any,
+    *,
+    agent: str,
+    task: str,
+    where: str = "input",
+) -> Tuple[Dict[str, Any], Any]:
+    """
+    Wie gate_array_input, liefert aber (gate, data) für den Agentenaufruf.
+    Lange Sequenzen werden in einem C-Durchlauf (np.asarray-dtype) geprüft;
+    der Python-Scan läuft nur noch, um bad_indices zu melden.
+    data ist die unveränderte Sequenz (Agenten arbeiten auf Listen).
+    """
+    if (
+        HAVE_NUMPY
+        and isinstance(seq, (list, tuple))
+        and len(seq) > NUMPY_GATE_MIN_LEN
+    ):
+        try:
+            arr = np.asarray(seq)
+        except ValueError:
+            arr = None
+        # nur flache Zahlenfolgen: 2-D/verschachtelt -> Element-Pfad meldet bad_indices
+        if arr is not None and arr.ndim == 1 and arr.dtype.kind in "biuf":
+            gate = _gate_result(
+                True,
+                level="gate",
+                where=where,
+                agent=agent,
+                task=task,
+                reason="Sequence OK.",
+                details={"length": len(seq)},
+            )
+            return gate, seq
+
+    return gate_array_input(seq, agent=agent, task=task, where=where), seq
+
+
 def gate_multiagent_input(
     data: Dict[str, Any],
     *,
@@ -14,17 +14,17 @@ API:
     - horizon_full
     - horizon_profile
     - horizon_forecast
+    - horizon_combined (full + profile in einem Lauf)
 """
 
 from __future__ import annotations
 from typing import List, Dict, Any
 import math
 
-
-def _to_float_list(x: Any) -> List[float]:
-    if isinstance(x, list):
-        return [float(v) for v in x]
-    return []
+try:
+    from .series_input import to_float_list
+except ImportError:
+    from series_input import to_float_list
 
 
 class HorizonAgent:
@@ -40,7 +40,7 @@ class HorizonAgent:
         with_debug=True,
         with_diagnostics=False,
     ):
-        errors = _to_float_list(payload.get("errors", []))
+        errors = to_float_list(payload.get("errors"))
         thr = float(payload.get("threshold", 1.0))
 
         if task == "horizon_full":
@@ -55,6 +55,10 @@ class HorizonAgent:
             result, dbg = self.horizon_forecast(errors, thr, with_debug)
             return {"ok": True, "result": result, "debug": dbg, "diagnostics": None}
 
+        if task == "horizon_combined":
+            result, dbg = self.horizon_combined(errors, thr, with_debug)
+            return {"ok": True, "result": result, "debug": dbg, "diagnostics": None}
+
         return {"ok": False, "result": None, "debug": {"error": f"Unknown task {task}"}}
     # --------------------------------------
     # Velocity & Acceleration
@@ -165,9 +169,17 @@ class HorizonAgent:
     # --------------------------------------
     def horizon_profile(self, errors, thr, with_debug):
         full, dbg = self.horizon_full(errors, thr, with_debug)
+        return self._profile_view(full), dbg
+
+    # --------------------------------------
+    def horizon_combined(self, errors, thr, with_debug):
+        full, dbg = self.horizon_full(errors, thr, with_debug)
+        return {"full": full, "profile": self._profile_view(full)}, dbg
+
+    def _profile_view(self, full):
         prof = full["HorizonProfile"]
 
-        profile = {
+        return {
             "HorizonProfile": {
                 "valid_length": prof["valid_length"],
                 "status": prof["status"],
@@ -175,7 +187,6 @@ class HorizonAgent:
                 "horizon_score": prof["horizon_score"],
             }
         }
-        return profile, dbg
 
     # --------------------------------------
     # FORECAST
@@ -2,7 +2,7 @@
 openai_config.py – Sichere OpenAI-Initialisierung für Saham-Lab
 """
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 # -----------------------------------------------------
 # Sicherheitsschalter:
@@ -11,6 +11,7 @@ from openai import OpenAI
 SAHAM_ENABLE_OPENAI = False    # <- Du kannst das später auf True setzen
 
 _client = None
+_async_client = None
 
 
 def get_client():
@@ -27,3 +28,18 @@ def get_client():
         _client = OpenAI()
 
     return _client
+
+
+def get_async_client():
+    """
+    Wie get_client, aber AsyncOpenAI (für run_orchestrator_async).
+    """
+    global _async_client
+
+    if not SAHAM_ENABLE_OPENAI:
+        raise RuntimeError("OpenAI ist deaktiviert (SAHAM_ENABLE_OPENAI=False).")
+
+    if _async_client is None:
+        _async_client = AsyncOpenAI()
+
+    return _async_client
@@ -0,0 +1,56 @@
+"""
+series_input.py – gemeinsame Eingangskonvertierung der Serien-Agenten
+(ClusterAgent, HorizonAgent, TrendAgent, ForecastAgent)
+
+Aufgabe:
+    values/errors aus dem Payload (Liste, Tuple oder 1-D-ndarray) einmal
+    in eine Liste von floats überführen.
+"""
+
+from __future__ import annotations
+from typing import Any, List
+
+# NumPy (optional, Konvertierung langer Serien in einem C-Durchlauf)
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# Ab dieser Länge konvertiert NumPy; darunter überwiegt der Array-Overhead
+NUMPY_MIN_LEN = 64
+
+
+def _to_float_array(x: Any):
+    """
+    float64-Array aus Liste/Tuple/1-D-ndarray – ein C-Durchlauf statt float() je Element.
+    None, wenn die Elemente nicht rein numerisch sind (None, Strings, Objekte);
+    dann entscheidet der Element-Pfad (gleiche Fehler wie bisher).
+    """
+    try:
+        a = np.asarray(x)
+    except (TypeError, ValueError):
+        return None
+    if a.ndim != 1 or a.dtype.kind not in "biuf":
+        return None
+    return a.astype(np.float64, copy=False)
+
+
+def to_float_list(x: Any) -> List[float]:
+    """
+    Liste/Tuple/1-D-ndarray -> Liste von floats, alles andere -> [].
+    Nicht-numerische Elemente werfen wie float(v).
+    """
+    is_seq = isinstance(x, (list, tuple))
+    is_array = not is_seq and getattr(x, "ndim", None) == 1
+    if not (is_seq or is_array):
+        return []
+
+    if HAVE_NUMPY and (is_array or len(x) >= NUMPY_MIN_LEN):
+        a = _to_float_array(x)
+        if a is not None:
+            return a.tolist()
+
+    # 1-D ndarray: tolist() löst die Elemente in einem C-Durchlauf auf
+    return [float(v) for v in (x.tolist() if is_array else x)]
@@ -9,22 +9,22 @@ API:
     - trend_full
     - trend_profile
     - trend_forecast
+    - trend_combined (full + profile in einem Lauf)
 """
 
 from __future__ import annotations
 from typing import List, Dict, Any
 import math
 
+try:
+    from .series_input import to_float_list
+except ImportError:
+    from series_input import to_float_list
+
 
 # ------------------------------------------------------------
 # Hilfsfunktionen
 # ------------------------------------------------------------
-def _to_float_list(x: Any) -> List[float]:
-    if isinstance(x, list):
-        return [float(v) for v in x]
-    return []
-
-
 # ------------------------------------------------------------
 # Hauptklasse
 # ------------------------------------------------------------
@@ -38,7 +38,7 @@ class TrendAgent:
         with_debug=True,
         with_diagnostics=False,
     ):
-        values = _to_float_list(payload.get("values", []))
+        values = to_float_list(payload.get("values"))
 
         if task == "trend_full":
             result, dbg = self.trend_full(values, with_debug)
@@ -52,6 +52,10 @@ class TrendAgent:
             result, dbg = self.trend_forecast(values, with_debug)
             return {"ok": True, "result": result, "debug": dbg, "diagnostics": None}
 
+        if task == "trend_combined":
+            result, dbg = self.trend_combined(values, with_debug)
+            return {"ok": True, "result": result, "debug": dbg, "diagnostics": None}
+
         return {"ok": False, "result": None, "debug": {"error": f"Unknown task {task}"}}
     # ------------------------------------------------------------
     # Slope / SmoothSlope / Drift / Volatility / Acceleration
@@ -192,16 +196,23 @@ class TrendAgent:
     # ------------------------------------------------------------
     def trend_profile(self, values: List[float], with_debug=True):
         full, dbg = self.trend_full(values, with_debug)
+        return self._profile_view(full), dbg
+
+    # ------------------------------------------------------------
+    def trend_combined(self, values: List[float], with_debug=True):
+        full, dbg = self.trend_full(values, with_debug)
+        return {"full": full, "profile": self._profile_view(full)}, dbg
+
+    def _profile_view(self, full: Dict) -> Dict:
         prof = full["TrendProfile"]
 
-        profile = {
+        return {
             "TrendProfile": {
                 "regime": prof["regime"],
                 "phase": prof["phase"],
                 "trend_score": prof["trend_score"],
             }
         }
-        return profile, dbg
 
     # ------------------------------------------------------------
     def trend_forecast(self, values: List[float], with_debug=True):